@@ -1,9 +1,11 @@
-import json
+import atexit
 import re
 import time
 from pathlib import Path
 from typing import Any, Dict
 
+from app.utils.jsonio import JSONDecodeError, dumps, loads
+
 # -------------------------
 # Constants
 # -------------------------
@@ -31,12 +33,14 @@ HISTORY_FILE = PRIVATE_DIR / "tesla_order_history.json"
 TESLA_STORES_FILE = PUBLIC_DIR / "tesla_locations.json"
 SETTINGS_FILE = PRIVATE_DIR / "settings.json"
 
+# trailing commas before } or ] (hand-edited settings files)
+_TRAILING_COMMA_RE = re.compile(r",\s*([\]}])")
+
 # -------------------------
 # Dataobjects
 # -------------------------
 try:
-    with open(TESLA_STORES_FILE, encoding="utf-8") as f:
-        TESLA_STORES = json.load(f)
+    TESLA_STORES = loads(TESLA_STORES_FILE.read_bytes())
 except:
     TESLA_STORES = {}
 
@@ -45,44 +49,57 @@ class Config:
     def __init__(self, path: Path):
         self._path = path
         self._cfg: Dict[str, Any] = {}
+        self._dirty = False
         self.load()  # gleich beim Init laden
+        atexit.register(self._flush_if_dirty)
 
     def load(self) -> None:
+        if self._dirty:
+            # unsaved changes in memory take precedence over the file
+            return
         if not self._path.exists():
             self._cfg = {}
             return
+        raw = self._path.read_bytes()
         try:
-            with self._path.open(encoding="utf-8") as f:
-                text = f.read()
-                # remove trailing commas before } or ]
-                text = re.sub(r",\s*([\]\}])", r"\1", text)
-                self._cfg = json.loads(text)
-        except json.JSONDecodeError as e:
-            self._cfg = {}
-            return
+            self._cfg = loads(raw)
+        except JSONDecodeError:
+            # only pay for the regex scan if the file is not valid JSON as-is
+            text = raw.decode("utf-8")
+            try:
+                self._cfg = loads(_TRAILING_COMMA_RE.sub(r"\1", text))
+            except JSONDecodeError:
+                self._cfg = {}
 
     def save(self) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        text = (
-            json.dumps(self._cfg, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
-        )
+        text = dumps(self._cfg, indent=True, sort_keys=True) + "\n"
         tmp = self._path.with_suffix(self._path.suffix + ".tmp")
         tmp.write_text(text, encoding="utf-8")
         tmp.replace(self._path)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write pending changes to disk now instead of at interpreter exit."""
+        self._flush_if_dirty()
+
+    def _flush_if_dirty(self) -> None:
+        if self._dirty:
+            self.save()
 
     def get(self, key: str, default: Any = None) -> Any:
         return self._cfg.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         self._cfg[key] = value
-        self.save()
+        self._dirty = True
 
     def has(self, key: str) -> bool:
         return key in self._cfg
 
     def delete(self, key: str) -> None:
         self._cfg.pop(key, None)
-        self.save()
+        self._dirty = True
 
 
 cfg = Config(SETTINGS_FILE)
@@ -8,23 +8,72 @@ Migration: 2025-08-23-history
 
 from __future__ import annotations
 
-import json
 import re
 from pathlib import Path
-from typing import Any, List, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from app.config import BASE_DIR, PRIVATE_DIR
+from app.utils.jsonio import dumps_bytes, loads
+
+_ADDED_KEY_RE = re.compile(r"\+ Added key '([^']+)': (.*)")
+_REMOVED_KEY_RE = re.compile(r"- Removed key '([^']+)'")
+_ADDED_ORDER_RE = re.compile(r"\+ Added order (\d+)")
+_REMOVED_ORDER_RE = re.compile(r"- Removed order (\d+)")
+_OLD_VALUE_RE = re.compile(r"- ([^:]+): (.*)")
+_NEW_VALUE_RE = re.compile(r"\+ ([^:]+): (.*)")
+
+
+def _parse_added_key(change: str) -> Optional[Dict[str, Any]]:
+    m = _ADDED_KEY_RE.match(change)
+    if not m:
+        return None
+    key = m.group(1).replace("Order ", "", 1)
+    return {"operation": "added", "key": key, "value": m.group(2)}
+
+
+def _parse_removed_key(change: str) -> Optional[Dict[str, Any]]:
+    m = _REMOVED_KEY_RE.match(change)
+    if not m:
+        return None
+    key = m.group(1).replace("Order ", "", 1)
+    return {"operation": "removed", "key": key, "old_value": None}
+
+
+def _parse_added_order(change: str) -> Optional[Dict[str, Any]]:
+    m = _ADDED_ORDER_RE.match(change)
+    if not m:
+        return None
+    return {"operation": "added", "key": m.group(1)}
+
+
+def _parse_removed_order(change: str) -> Optional[Dict[str, Any]]:
+    m = _REMOVED_ORDER_RE.match(change)
+    if not m:
+        return None
+    return {"operation": "removed", "key": m.group(1)}
+
+
+# The four single-line prefixes differ within their first 11 characters, so
+# one slice + dict lookup replaces the chain of startswith() probes.
+_PREFIX_HEAD_LEN = 11
+_PREFIX_HANDLERS: Dict[str, Tuple[str, Callable[[str], Optional[Dict[str, Any]]]]] = {
+    prefix[:_PREFIX_HEAD_LEN]: (prefix, parser)
+    for prefix, parser in (
+        ("+ Added key '", _parse_added_key),
+        ("- Removed key '", _parse_removed_key),
+        ("+ Added order ", _parse_added_order),
+        ("- Removed order ", _parse_removed_order),
+    )
+}
 
 
 def _load_json(path: Path) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return loads(path.read_bytes())
 
 
 def _save_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f)
+    path.write_bytes(dumps_bytes(data))
 
 
 def _migrate_history_format(history: List[Dict[str, Any]]):
@@ -48,58 +97,22 @@ def _migrate_history_format(history: List[Dict[str, Any]]):
                 i += 1
                 continue
 
-            if change.startswith("+ Added key '"):
-                m = re.match(r"\+ Added key '([^']+)': (.*)", change)
-                if m:
-                    key = m.group(1).replace("Order ", "", 1)
-                    new_entry["changes"].append(
-                        {
-                            "operation": "added",
-                            "key": key,
-                            "value": m.group(2),
-                        }
-                    )
-                i += 1
-            elif change.startswith("- Removed key '"):
-                m = re.match(r"- Removed key '([^']+)'", change)
-                if m:
-                    key = m.group(1).replace("Order ", "", 1)
-                    new_entry["changes"].append(
-                        {
-                            "operation": "removed",
-                            "key": key,
-                            "old_value": None,
-                        }
-                    )
-                i += 1
-            elif change.startswith("+ Added order "):
-                m = re.match(r"\+ Added order (\d+)", change)
-                if m:
-                    new_entry["changes"].append(
-                        {
-                            "operation": "added",
-                            "key": m.group(1),
-                        }
-                    )
-                i += 1
-            elif change.startswith("- Removed order "):
-                m = re.match(r"- Removed order (\d+)", change)
-                if m:
-                    new_entry["changes"].append(
-                        {
-                            "operation": "removed",
-                            "key": m.group(1),
-                        }
-                    )
+            handler = _PREFIX_HANDLERS.get(change[:_PREFIX_HEAD_LEN])
+            if handler is not None and change.startswith(handler[0]):
+                parsed = handler[1](change)
+                if parsed:
+                    new_entry["changes"].append(parsed)
                 i += 1
-            elif change.startswith("- "):
+                continue
+
+            if change.startswith("- "):
                 if (
                     i + 1 < len(changes)
                     and isinstance(changes[i + 1], str)
                     and changes[i + 1].startswith("+ ")
                 ):
-                    m_old = re.match(r"- ([^:]+): (.*)", change)
-                    m_new = re.match(r"\+ ([^:]+): (.*)", changes[i + 1])
+                    m_old = _OLD_VALUE_RE.match(change)
+                    m_new = _NEW_VALUE_RE.match(changes[i + 1])
                     if m_old and m_new and m_old.group(1) == m_new.group(1):
                         key = m_old.group(1).replace("Order ", "", 1)
                         new_entry["changes"].append(
@@ -112,9 +125,7 @@ def _migrate_history_format(history: List[Dict[str, Any]]):
                         )
                         i += 2
                         continue
-                i += 1
-            else:
-                i += 1
+            i += 1
         migrated.append(new_entry)
     return migrated
 
@@ -7,22 +7,20 @@ Migration: 2025-09-05-history-trim
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 from app.config import BASE_DIR, PRIVATE_DIR
+from app.utils.jsonio import dumps_bytes, loads
 
 
 def _load_json(path: Path) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return loads(path.read_bytes())
 
 
 def _save_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f)
+    path.write_bytes(dumps_bytes(data))
 
 
 def _strip_history_values(
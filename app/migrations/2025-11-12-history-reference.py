@@ -8,23 +8,43 @@ Migration: 2025-11-12-history-reference
 
 from __future__ import annotations
 
-import json
-from collections import defaultdict
+import mmap
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from app.config import ORDERS_FILE, HISTORY_FILE
+from app.utils.jsonio import HAS_ORJSON, dumps_bytes, loads
+
+_CHANGE_FIELDS = frozenset(("operation", "key", "value", "old_value"))
+
+# above this size the history is parsed straight from a memory map (orjson only)
+MMAP_THRESHOLD = 50 * 1024 * 1024
 
 
 def _load_json(path: Path) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return loads(view)
+        return loads(f.read())
 
 
 def _save_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f)
+    path.write_bytes(dumps_bytes(data))
+
+
+def _peek_json_kind(path: Path) -> Optional[str]:
+    """Return the first non-whitespace character of *path* (``{`` or ``[``)."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4096).lstrip()
+    except OSError:
+        return None
+    return chr(head[0]) if head else None
 
 
 def _extract_reference(entry: Any) -> Optional[str]:
@@ -41,7 +61,9 @@ def _extract_reference(entry: Any) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=None)
 def _build_index_map() -> Dict[str, str]:
+    """Map legacy order indexes to references (orders file is read once, on demand)."""
     if not ORDERS_FILE.exists():
         return {}
     try:
@@ -64,7 +86,7 @@ def _build_index_map() -> Dict[str, str]:
 
 
 def _resolve_reference_and_key(
-    change: Dict[str, Any], index_map: Dict[str, str]
+    change: Dict[str, Any], get_index_map: Callable[[], Dict[str, str]]
 ) -> Tuple[Optional[str], str]:
     if not isinstance(change, dict):
         return None, ""
@@ -77,12 +99,16 @@ def _resolve_reference_and_key(
     else:
         prefix, remainder = key_str, ""
 
+    # RN… prefixes name the order themselves; the orders file is only
+    # consulted for other prefixes (legacy numeric indexes)
+    is_reference_prefix = prefix.upper().startswith("RN")
+
     reference = change.get("order_reference")
     if reference is None and prefix:
-        if prefix in index_map:
-            reference = index_map[prefix]
-        elif prefix.upper().startswith("RN"):
+        if is_reference_prefix:
             reference = prefix
+        elif prefix in get_index_map():
+            reference = get_index_map()[prefix]
         elif prefix.isdigit():
             reference = prefix  # legacy fallback (numeric index)
 
@@ -94,9 +120,9 @@ def _resolve_reference_and_key(
     if prefix:
         if (
             prefix == ref_str
-            or prefix in index_map
-            or prefix.upper().startswith("RN")
+            or is_reference_prefix
             or prefix.isdigit()
+            or prefix in get_index_map()
         ):
             drop_prefix = True
     normalized_key = remainder if drop_prefix else key_str
@@ -104,9 +130,9 @@ def _resolve_reference_and_key(
 
 
 def _migrate_history(
-    history: List[Dict[str, Any]], index_map: Dict[str, str]
+    history: List[Dict[str, Any]], get_index_map: Callable[[], Dict[str, str]]
 ) -> Dict[str, List[Dict[str, Any]]]:
-    grouped_history: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    grouped_history: Dict[str, List[Dict[str, Any]]] = {}
 
     for entry in history:
         if not isinstance(entry, dict):
@@ -116,32 +142,44 @@ def _migrate_history(
         if not isinstance(entry_changes, list):
             continue
 
-        per_reference: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        per_reference: Dict[str, List[Dict[str, Any]]] = {}
         for change in entry_changes:
-            reference, key = _resolve_reference_and_key(change, index_map)
+            reference, key = _resolve_reference_and_key(change, get_index_map)
             if not reference:
                 continue
-            normalized_change = {
-                "operation": change.get("operation"),
-                "key": key,
-                "value": change.get("value"),
-                "old_value": change.get("old_value"),
-            }
-            per_reference[reference].append(normalized_change)
+            if change.keys() <= _CHANGE_FIELDS:
+                # already in the target shape: reuse the parsed dict
+                change["key"] = key
+                change.setdefault("operation", None)
+                change.setdefault("value", None)
+                change.setdefault("old_value", None)
+                normalized_change = change
+            else:
+                get = change.get
+                normalized_change = {
+                    "operation": get("operation"),
+                    "key": key,
+                    "value": get("value"),
+                    "old_value": get("old_value"),
+                }
+            per_reference.setdefault(reference, []).append(normalized_change)
 
         for reference, changes in per_reference.items():
             if not changes:
                 continue
-            grouped_history[str(reference)].append(
+            grouped_history.setdefault(str(reference), []).append(
                 {"timestamp": timestamp, "changes": changes}
             )
 
-    return dict(grouped_history)
+    return grouped_history
 
 
 def run() -> None:  # noqa: ARG001
     if not HISTORY_FILE.exists():
         return
+    # dict payloads are already migrated; avoid parsing the whole file
+    if _peek_json_kind(HISTORY_FILE) == "{":
+        return
     try:
         history = _load_json(HISTORY_FILE)
     except Exception:
@@ -152,7 +190,6 @@ def run() -> None:  # noqa: ARG001
     if not isinstance(history, list):
         return
 
-    index_map = _build_index_map()
-    migrated = _migrate_history(history, index_map)
+    migrated = _migrate_history(history, _build_index_map)
     if migrated:
         _save_json(HISTORY_FILE, migrated)
@@ -6,23 +6,31 @@ Migration: 2025-11-12-orders-map
 
 from __future__ import annotations
 
-import json
 from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from app.config import ORDERS_FILE
+from app.utils.jsonio import dumps_bytes, loads
 
 
 def _load_json(path: Path) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return loads(path.read_bytes())
 
 
 def _save_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f)
+    path.write_bytes(dumps_bytes(data))
+
+
+def _peek_json_kind(path: Path) -> Optional[str]:
+    """Return the first non-whitespace character of *path* (``{`` or ``[``)."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4096).lstrip()
+    except OSError:
+        return None
+    return chr(head[0]) if head else None
 
 
 def _extract_reference(entry: Dict[str, Any]) -> Optional[str]:
@@ -42,6 +50,9 @@ def _extract_reference(entry: Dict[str, Any]) -> Optional[str]:
 def run() -> None:  # noqa: ARG001
     if not ORDERS_FILE.exists():
         return
+    # dict payloads are already migrated; avoid parsing the whole file
+    if _peek_json_kind(ORDERS_FILE) == "{":
+        return
 
     try:
         orders_data = _load_json(ORDERS_FILE)
@@ -55,15 +66,20 @@ def run() -> None:  # noqa: ARG001
         return
 
     new_orders: OrderedDict[str, Any] = OrderedDict()
+    # next suffix to try per duplicated reference; lower ones are all taken
+    next_suffix: Dict[str, int] = {}
     for idx, entry in enumerate(orders_data):
         if not isinstance(entry, dict):
             continue
         reference = _extract_reference(entry) or f"legacy-{idx}"
         candidate = reference
-        suffix = 1
-        while candidate in new_orders:
+        if candidate in new_orders:
+            suffix = next_suffix.get(reference, 1)
             candidate = f"{reference}-{suffix}"
-            suffix += 1
+            while candidate in new_orders:
+                suffix += 1
+                candidate = f"{reference}-{suffix}"
+            next_suffix[reference] = suffix + 1
         new_orders[candidate] = entry
 
     if not new_orders:
@@ -8,20 +8,21 @@ import argparse
 import hashlib
 import os
 import shutil
+import stat
 import sys
-import tempfile
+import threading
+import time
 import traceback
-import webbrowser
 import zipfile
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urljoin, urlparse
 
-import requests
-
 from app.config import (
     APP_DIR,
     BASE_DIR,
+    PRIVATE_DIR,
     PUBLIC_DIR,
     TESLA_STORES_FILE,
     VERSION,
@@ -29,6 +30,7 @@ from app.config import (
 )
 from app.utils.colors import color_text
 from app.utils.connection import request_with_retry
+from app.utils.jsonio import dumps, loads
 from app.utils.locale import t
 
 FILES_TO_CHECK: List[Path] = [
@@ -57,6 +59,8 @@ RELEASE_API_URL = (
 )
 RELEASE_PAGE_URL = "https://github.com/trappiz/tesla-order-status/releases/latest"
 ISSUES_URL = "https://github.com/trappiz/tesla-order-status/issues"
+RELEASE_CACHE_FILE = PRIVATE_DIR / "release_cache.json"
+RELEASE_CACHE_TTL = 3600  # seconds
 GITHUB_DOWNLOAD_ALLOWED_HOSTS = {
     "api.github.com",
     "github.com",
@@ -66,22 +70,6 @@ GITHUB_DOWNLOAD_ALLOWED_HOSTS = {
 }
 
 
-def _copytree_compat(src: Path, dst: Path) -> None:
-    if sys.version_info >= (3, 8):
-        shutil.copytree(src, dst, dirs_exist_ok=True)
-        return
-
-    if dst.exists() and not dst.is_dir():
-        raise ValueError(f"Target path {dst} exists and is not a directory")
-    dst.mkdir(parents=True, exist_ok=True)
-    for child in src.iterdir():
-        target = dst / child.name
-        if child.is_dir():
-            _copytree_compat(child, target)
-        else:
-            shutil.copy2(child, target)
-
-
 def _parse_version(tag: str) -> Optional[Tuple[int, ...]]:
     if not isinstance(tag, str):
         return None
@@ -107,25 +95,89 @@ def _is_newer_version(candidate: str, current: str) -> bool:
     return candidate_version > current_version
 
 
-def _get_latest_release() -> Dict[str, Any]:
-    response = request_with_retry(
-        RELEASE_API_URL,
-        headers={
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-        },
-        exit_on_error=False,
-        network_scope="update",
-    )
+def _load_release_cache() -> Dict[str, Any]:
+    try:
+        payload = loads(RELEASE_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("url") != RELEASE_API_URL:
+        return {}
+    if not isinstance(payload.get("release"), dict):
+        return {}
+    return payload
+
+
+def _slim_release(release: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the release fields the updater reads (drops notes, uploaders)."""
+    slim: Dict[str, Any] = {
+        key: release.get(key) for key in ("tag_name", "name", "zipball_url")
+    }
+    assets = release.get("assets")
+    if isinstance(assets, list):
+        slim["assets"] = [
+            {
+                "name": asset.get("name"),
+                "browser_download_url": asset.get("browser_download_url"),
+            }
+            for asset in assets
+            if isinstance(asset, dict)
+        ]
+    return slim
+
+
+def _save_release_cache(release: Dict[str, Any], etag: Optional[str]) -> None:
+    payload = {
+        "url": RELEASE_API_URL,
+        "cached_at": time.time(),
+        "etag": etag,
+        "release": _slim_release(release),
+    }
+    try:
+        RELEASE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        RELEASE_CACHE_FILE.write_text(dumps(payload), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _get_latest_release(use_cache: bool = False) -> Dict[str, Any]:
+    """Return the latest release metadata from GitHub.
+
+    With *use_cache* a copy younger than ``RELEASE_CACHE_TTL`` is returned
+    without any network access; an older copy is revalidated via ETag so an
+    unchanged release costs a bodyless ``304`` response.
+    """
+    cache = _load_release_cache() if use_cache else {}
+    cached_release = cache.get("release")
+    if cached_release is not None:
+        cached_at = cache.get("cached_at")
+        if isinstance(cached_at, (int, float)):
+            if 0 <= time.time() - cached_at < RELEASE_CACHE_TTL:
+                return cached_release
+
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    etag = cache.get("etag")
+    if cached_release is not None and isinstance(etag, str) and etag:
+        headers["If-None-Match"] = etag
+
+    response = request_with_retry(RELEASE_API_URL, headers=headers, exit_on_error=False)
     if response is None:
         raise RuntimeError("Could not load latest release metadata")
-    payload = response.json()
+    if response.status_code == 304 and cached_release is not None:
+        _save_release_cache(cached_release, etag)
+        return cached_release
+    payload = loads(response.content)
     if not isinstance(payload, dict):
         raise RuntimeError("Invalid latest release metadata")
+    _save_release_cache(payload, response.headers.get("ETag"))
     return payload
 
 
 def _open_release_page() -> None:
+    import webbrowser
+
     try:
         opened = webbrowser.open(RELEASE_PAGE_URL)
         if not opened:
@@ -136,8 +188,26 @@ def _open_release_page() -> None:
         print(RELEASE_PAGE_URL)
 
 
-def _missing_files() -> List[Path]:
-    return [path for path in FILES_TO_CHECK if not path.exists() or not path.is_file()]
+def _is_regular_file(path: Path) -> bool:
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _missing_files(first_only: bool = False) -> List[Path]:
+    """Return FILES_TO_CHECK entries that are missing.
+
+    With *first_only* the scan stops at the first missing file, for callers
+    that only need to know whether the package is complete.
+    """
+    missing: List[Path] = []
+    for path in FILES_TO_CHECK:
+        if not _is_regular_file(path):
+            missing.append(path)
+            if first_only:
+                break
+    return missing
 
 
 def _status_mode_enabled() -> bool:
@@ -165,6 +235,7 @@ def ask_for_update() -> int:
 
     if Config.get("update_method") == "automatically":
         Config.set("update_method", "manual")
+        Config.flush()
         print(
             color_text(
                 t(
@@ -216,11 +287,38 @@ def ask_for_update_consent() -> None:
         Config.set("update_method", "block")
     else:
         Config.set("update_method", "manual")
+    Config.flush()
+
+
+def _start_release_lookup(use_cache: bool) -> "Future[Dict[str, Any]]":
+    future: "Future[Dict[str, Any]]" = Future()
+
+    def _run() -> None:
+        try:
+            future.set_result(_get_latest_release(use_cache=use_cache))
+        except BaseException as error:
+            future.set_exception(error)
+
+    # daemon, so an early sys.exit() never waits on an in-flight request
+    threading.Thread(target=_run, daemon=True).start()
+    return future
 
 
 def check_for_updates(respect_preferences: bool = True) -> int:
     status_mode = _status_mode_enabled()
-    missing = _missing_files()
+    # startup checks may reuse a recent answer; explicit --check always asks
+    use_cache = respect_preferences
+    release_future = None
+    if not respect_preferences or Config.get("update_method") in {
+        "manual",
+        "automatically",
+    }:
+        # overlap the network round trip with the local file scan; only when
+        # the stored preference already allows update checks
+        release_future = _start_release_lookup(use_cache)
+
+    # --status only reports "corrupt", so the first missing file is enough
+    missing = _missing_files(first_only=status_mode)
     if missing:
         if status_mode:
             print(2)
@@ -244,6 +342,7 @@ def check_for_updates(respect_preferences: bool = True) -> int:
 
         if Config.get("update_method") == "automatically":
             Config.set("update_method", "manual")
+            Config.flush()
             if not status_mode:
                 print(
                     color_text(
@@ -258,7 +357,10 @@ def check_for_updates(respect_preferences: bool = True) -> int:
             return 0
 
     try:
-        latest_release = _get_latest_release()
+        if release_future is not None:
+            latest_release = release_future.result()
+        else:
+            latest_release = _get_latest_release(use_cache=use_cache)
     except Exception as error:
         if status_mode:
             print(-1)
@@ -337,25 +439,31 @@ def _select_release_checksum_asset(
     if not isinstance(assets, list):
         return None
 
-    checksum_assets = []
+    # single pass: first checksum matching the archive wins, otherwise fall
+    # back to the only checksum asset if there is exactly one
+    only_checksum: Optional[Dict[str, str]] = None
+    checksum_count = 0
     for asset in assets:
         if not isinstance(asset, dict):
             continue
         name = str(asset.get("name") or "").strip()
         url = str(asset.get("browser_download_url") or "").strip()
-        if name.endswith((".sha256", ".sha256sum")) and url:
-            checksum_assets.append({"name": name, "url": url})
-
-    for asset in checksum_assets:
-        if asset["name"].startswith(archive_name):
-            return asset
+        if not (name.endswith((".sha256", ".sha256sum")) and url):
+            continue
+        if name.startswith(archive_name):
+            return {"name": name, "url": url}
+        checksum_count += 1
+        if checksum_count == 1:
+            only_checksum = {"name": name, "url": url}
 
-    if len(checksum_assets) == 1:
-        return checksum_assets[0]
-    return None
+    return only_checksum if checksum_count == 1 else None
 
 
 def _download_url_to_file(url: str, destination: Path) -> Path:
+    # imported here so startup checks (or users with updates blocked) don't
+    # pay for it unless a download actually happens
+    import requests
+
     session = requests.Session()
     current_url = url
 
@@ -429,22 +537,59 @@ def _is_symlink(member: zipfile.ZipInfo) -> bool:
     return ((member.external_attr >> 16) & 0o170000) == 0o120000
 
 
-def _safe_extract_zip(zf: zipfile.ZipFile, target_dir: Path) -> None:
+def _extract_release_archive(zf: zipfile.ZipFile, target_dir: Path) -> None:
+    """Write the archive's single top-level directory straight into *target_dir*.
+
+    Every entry is validated and every file is written to a sibling ``.tmp``
+    file before the first one is moved into place, so a rejected archive or a
+    failed write (disk full, permissions, a corrupt member) leaves the
+    installation untouched.
+    """
+    members = [member for member in zf.infolist() if member.filename]
+    top_dirs = {
+        member.filename.split("/", 1)[0]
+        for member in members
+        if member.is_dir() or "/" in member.filename
+    }
+    if len(top_dirs) != 1:
+        raise ValueError("Expected a single top-level directory inside the archive")
+    prefix = top_dirs.pop() + "/"
+
     root = target_dir.resolve()
-    for member in zf.infolist():
-        if not member.filename:
-            continue
-        target_path = (target_dir / member.filename).resolve()
-        if not _is_within_directory(root, target_path):
-            raise ValueError(f"Unsafe archive entry: {member.filename}")
+    planned: List[Tuple[zipfile.ZipInfo, Path]] = []
+    for member in members:
         if _is_symlink(member):
             raise ValueError(f"Symlink entries are not allowed: {member.filename}")
-        if member.is_dir():
-            target_path.mkdir(parents=True, exist_ok=True)
-            continue
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        with zf.open(member) as source, open(target_path, "wb") as destination:
-            shutil.copyfileobj(source, destination)
+        inside = member.filename.startswith(prefix)
+        relative = member.filename[len(prefix) :] if inside else member.filename
+        target_path = (root / relative).resolve()
+        if not _is_within_directory(root, target_path):
+            raise ValueError(f"Unsafe archive entry: {member.filename}")
+        # entries next to the top-level directory are validated but not applied
+        if inside and target_path != root:
+            planned.append((member, target_path))
+
+    staged: List[Tuple[Path, Path]] = []
+    try:
+        for member, target_path in planned:
+            if member.is_dir():
+                target_path.mkdir(parents=True, exist_ok=True)
+                continue
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target_path.with_name(target_path.name + ".tmp")
+            staged.append((tmp_path, target_path))
+            with zf.open(member) as source, open(tmp_path, "wb") as destination:
+                shutil.copyfileobj(source, destination, 1024 * 1024)
+    except BaseException:
+        for tmp_path, _ in staged:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        raise
+
+    for tmp_path, target_path in staged:
+        os.replace(tmp_path, target_path)
 
 
 def _prompt_archive_path() -> Path:
@@ -522,21 +667,8 @@ def apply_release_archive(
         )
 
     print("\nValidating and extracting archive...")
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        with zipfile.ZipFile(archive_path) as zf:
-            _safe_extract_zip(zf, tmp_path)
-
-        extracted_dirs = [path for path in tmp_path.iterdir() if path.is_dir()]
-        if len(extracted_dirs) != 1:
-            raise ValueError("Expected a single top-level directory inside the archive")
-        extracted_dir = extracted_dirs[0]
-        for item in extracted_dir.iterdir():
-            target = target_dir / item.name
-            if item.is_dir():
-                _copytree_compat(item, target)
-            else:
-                shutil.copy2(item, target)
+    with zipfile.ZipFile(archive_path) as zf:
+        _extract_release_archive(zf, target_dir)
 
 
 def _print_apply_success() -> None:
@@ -677,7 +809,6 @@ __all__ = [
     "_is_allowed_download_url",
     "_is_newer_version",
     "_parse_version",
-    "_safe_extract_zip",
     "_sanitize_tag",
     "_select_release_archive",
     "_select_release_checksum_asset",
@@ -1,16 +1,16 @@
 import os
 import base64
 import hashlib
-import json
 import time
 import urllib.parse
 import webbrowser
-import requests
 import sys
+from typing import Dict
 from app.config import TOKEN_FILE
 from app.utils.colors import color_text
 from app.utils.connection import request_with_retry
 from app.utils.helpers import exit_with_status
+from app.utils.jsonio import JSONDecodeError, dumps_bytes, loads
 from app.utils.locale import t
 from app.utils.params import STATUS_MODE
 
@@ -20,61 +20,62 @@ AUTH_URL = "https://auth.tesla.com/oauth2/v3/authorize"
 TOKEN_URL = "https://auth.tesla.com/oauth2/v3/token"
 SCOPE = "openid email offline_access"
 CODE_CHALLENGE_METHOD = "S256"
-STATE = os.urandom(16).hex()
 
 
 def _generate_code_verifier_and_challenge():
-    code_verifier = (
-        base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=").decode("utf-8")
-    )
+    # keep the verifier as bytes for hashing; base64 output is pure ASCII
+    code_verifier = base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=")
     code_challenge = (
-        base64.urlsafe_b64encode(hashlib.sha256(code_verifier.encode("utf-8")).digest())
+        base64.urlsafe_b64encode(hashlib.sha256(code_verifier).digest())
         .rstrip(b"=")
-        .decode("utf-8")
+        .decode("ascii")
     )
-    return code_verifier, code_challenge
+    return code_verifier.decode("ascii"), code_challenge
 
 
 def _get_auth_code(code_challenge: str):
+    # fresh CSRF state per login flow, not per process
+    state = os.urandom(16).hex()
     auth_params = {
         "client_id": CLIENT_ID,
         "redirect_uri": REDIRECT_URI,
         "response_type": "code",
         "scope": SCOPE,
-        "state": STATE,
+        "state": state,
         "code_challenge": code_challenge,
         "code_challenge_method": CODE_CHALLENGE_METHOD,
     }
 
     auth_url = f"{AUTH_URL}?{urllib.parse.urlencode(auth_params)}"
-    print(
+    # the whole intro goes out in a single write
+    intro = (
         color_text(
             t(
                 "To retrieve your order status, you need to authenticate with your Tesla account."
             ),
             "93",
-        )
-    )
-    message_parts = [
-        color_text(
-            t(
-                "A browser window will open with the Tesla login page. After logging in you will likely see a"
-            ),
-            93,
         ),
-        color_text(t('"Page Not Found"'), 91),
-        color_text(t("page."), 93),
-        color_text(t("That is CORRECT!"), 91),
-    ]
-    print(" ".join(message_parts))
-    print(
+        " ".join(
+            (
+                color_text(
+                    t(
+                        "A browser window will open with the Tesla login page. After logging in you will likely see a"
+                    ),
+                    93,
+                ),
+                color_text(t('"Page Not Found"'), 91),
+                color_text(t("page."), 93),
+                color_text(t("That is CORRECT!"), 91),
+            )
+        ),
         color_text(
             t(
                 "Copy the full URL of that page and return here. The authentication happens only between you and Tesla; no data leaves your system."
             ),
             "93",
-        )
+        ),
     )
+    print("\n".join(intro))
     if (
         input(color_text(t("Proceed to open the login page? (y/n): "), "93")).lower()
         != "y"
@@ -82,12 +83,12 @@ def _get_auth_code(code_challenge: str):
         print(color_text(t("Authentication cancelled."), "91"))
         sys.exit(0)
     try:
-        if not webbrowser.open(auth_url):
-            print(color_text(t("No GUI detected. Open this URL manually:"), 91))
-            print(f"{auth_url}")
+        opened = webbrowser.open(auth_url)
     except Exception:
+        opened = False
+    if not opened:
         print(color_text(t("No GUI detected. Open this URL manually:"), 91))
-        print(f"{auth_url}")
+        print(auth_url)
 
     redirected_url = input(
         color_text(t("Please enter the redirected URL here: "), "93")
@@ -103,8 +104,8 @@ def _get_auth_code(code_challenge: str):
     if not returned_state:
         exit_with_status(t("No state parameter found in the redirected URL."))
 
-    # Validate that the returned state matches the one we sent (STATE)
-    if returned_state[0] != STATE:
+    # Validate that the returned state matches the one we sent
+    if returned_state[0] != state:
         exit_with_status(
             t(
                 "Security Error (CSRF protection): State parameter mismatch! Authentication aborted."
@@ -118,6 +119,12 @@ def _get_auth_code(code_challenge: str):
     return code[0]
 
 
+def _authenticate():
+    # PKCE material is only needed when we actually run the browser login
+    code_verifier, code_challenge = _generate_code_verifier_and_challenge()
+    return _exchange_code_for_tokens(_get_auth_code(code_challenge), code_verifier)
+
+
 def _exchange_code_for_tokens(auth_code, code_verifier):
     token_data = {
         "grant_type": "authorization_code",
@@ -131,23 +138,29 @@ def _exchange_code_for_tokens(auth_code, code_verifier):
 
 
 def _save_tokens_to_file(tokens):
-    with open(TOKEN_FILE, "w") as f:
-        json.dump(tokens, f)
+    TOKEN_FILE.write_bytes(dumps_bytes(tokens))
     if not STATUS_MODE:
         print(color_text(t("> Tokens saved to '{file}'").format(file=TOKEN_FILE), "94"))
 
 
 def _load_tokens_from_file():
-    with open(TOKEN_FILE, "r") as f:
-        return json.load(f)
+    return loads(TOKEN_FILE.read_bytes())
 
 
-def _is_token_valid(access_token):
+# decoded "exp" claim per access token, so each JWT payload is parsed only once
+_EXP_CACHE: Dict[str, float] = {}
+
+
+def _get_token_expiry(access_token) -> float:
+    """Return the ``exp`` claim of *access_token* (0 if it cannot be read)."""
+    cached = _EXP_CACHE.get(access_token)
+    if cached is not None:
+        return cached
     try:
         # Ensure the token has three parts (Header.Payload.Signature)
         parts = access_token.split(".")
         if len(parts) != 3:
-            return False
+            return 0
 
         # Extract the payload and add the correct amount of padding
         payload = parts[1]
@@ -157,16 +170,22 @@ def _is_token_valid(access_token):
 
         # Decode securely using urlsafe_b64decode (standard for JWT)
         decoded_bytes = base64.urlsafe_b64decode(padded_payload)
-        jwt_decoded = json.loads(decoded_bytes.decode("utf-8"))
-
-        # Check expiration, adding a small buffer (e.g., 60 seconds)
-        # to ensure it doesn't expire exactly while we make the request
-        return jwt_decoded.get("exp", 0) > (time.time() + 60)
+        jwt_decoded = loads(decoded_bytes)
+        expiry = float(jwt_decoded.get("exp", 0))
 
-    except (IndexError, ValueError, TypeError, json.JSONDecodeError):
+    except (AttributeError, IndexError, ValueError, TypeError, JSONDecodeError):
         # If anything goes wrong (corrupted token, bad format),
         # assume the token is invalid and needs to be refreshed.
-        return False
+        return 0
+
+    _EXP_CACHE[access_token] = expiry
+    return expiry
+
+
+def _is_token_valid(access_token):
+    # Check expiration, adding a small buffer (e.g., 60 seconds)
+    # to ensure it doesn't expire exactly while we make the request
+    return _get_token_expiry(access_token) > (time.time() + 60)
 
 
 def refresh_tokens(refresh_token):
@@ -183,52 +202,47 @@ def refresh_tokens(refresh_token):
 # Main-Logic
 # ---------------------------
 def main() -> str:
-    code_verifier, code_challenge = _generate_code_verifier_and_challenge()
-
-    if os.path.exists(TOKEN_FILE):
-        try:
-            token_file = _load_tokens_from_file()
-            access_token = token_file["access_token"]
-            refresh_token = token_file["refresh_token"]
-
-            if not _is_token_valid(access_token):
-                if not STATUS_MODE:
-                    print(
-                        color_text(
-                            t(
-                                "> Access token is not valid anymore. Refreshing tokens..."
-                            ),
-                            "94",
-                        )
-                    )
-                token_response = refresh_tokens(refresh_token)
-                access_token = token_response["access_token"]
-                # refresh access token in file
-                token_file["access_token"] = access_token
-                _save_tokens_to_file(token_file)
+    tokens_missing = False
+    try:
+        token_file = _load_tokens_from_file()
+        access_token = token_file["access_token"]
+        refresh_token = token_file["refresh_token"]
 
-        except (json.JSONDecodeError, KeyError) as e:
+        if not _is_token_valid(access_token):
             if not STATUS_MODE:
                 print(
                     color_text(
-                        t("> Error loading tokens from file. Re-authenticating..."),
+                        t("> Access token is not valid anymore. Refreshing tokens..."),
                         "94",
                     )
                 )
-                token_response = _exchange_code_for_tokens(
-                    _get_auth_code(code_challenge), code_verifier
+            token_response = refresh_tokens(refresh_token)
+            access_token = token_response["access_token"]
+            # refresh access token in file
+            token_file["access_token"] = access_token
+            _save_tokens_to_file(token_file)
+
+    except FileNotFoundError:
+        # no token file yet; cheaper than a separate exists() check
+        tokens_missing = True
+    except (JSONDecodeError, KeyError) as e:
+        if not STATUS_MODE:
+            print(
+                color_text(
+                    t("> Error loading tokens from file. Re-authenticating..."),
+                    "94",
                 )
-                access_token = token_response["access_token"]
-                _save_tokens_to_file(token_response)
-            else:
-                print(-1)
-                sys.exit(0)
+            )
+            token_response = _authenticate()
+            access_token = token_response["access_token"]
+            _save_tokens_to_file(token_response)
+        else:
+            print(-1)
+            sys.exit(0)
 
-    else:
+    if tokens_missing:
         if not STATUS_MODE:
-            token_response = _exchange_code_for_tokens(
-                _get_auth_code(code_challenge), code_verifier
-            )
+            token_response = _authenticate()
             access_token = token_response["access_token"]
             if (
                 input(
@@ -1,13 +1,43 @@
 """Utility helpers for HTTP requests with retry logic."""
 
 import json as jsonlib
+import threading
 import time
-import requests
 from typing import Dict, Union
 
 from app.utils.helpers import exit_with_status
 from app.utils.locale import t
 
+# (connect, read) timeout in seconds, so a reused socket cannot mask a hang
+REQUEST_TIMEOUT = (3.05, 10)
+
+_SESSION = None
+# order-detail workers, telemetry and the release lookup may all ask first
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    """Return the shared ``requests.Session`` so sockets are kept alive."""
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            # retries are handled by request_with_retry itself. One pool per
+            # host a run talks to (Tesla auth, owner API, tasks gateway,
+            # tracker), so none is evicted and re-handshaked mid-run;
+            # pool_maxsize covers the parallel order-detail fetches.
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0),
+            )
+            _SESSION = session
+    return _SESSION
+
 
 def request_with_retry(
     url, headers=None, data=None, json=None, max_retries=3, exit_on_error=True
@@ -31,6 +61,10 @@ def request_with_retry(
         and terminates the program on failure. When ``False`` a ``RuntimeError``
         is raised instead so callers can handle network issues gracefully.
     """
+    # Local import keeps ``requests`` off the startup path until a call is made
+    import requests
+
+    session = _get_session()
     _STATUS_TEXTS: Dict[Union[int, str], str] = {
         400: t("400"),
         401: t("401"),
@@ -43,23 +77,28 @@ def request_with_retry(
     for attempt in range(max_retries):
         try:
             if data is None and json is None:
-                response = requests.get(url, headers=headers)
+                response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
             else:
                 if json is not None:
-                    response = requests.post(url, headers=headers, json=json)
+                    response = session.post(
+                        url, headers=headers, json=json, timeout=REQUEST_TIMEOUT
+                    )
                 else:
                     # If string/bytes: send directly; if dict: send cleanly as JSON.
                     if isinstance(data, (dict, list)):
-                        response = requests.post(
+                        response = session.post(
                             url,
                             headers={
                                 "Content-Type": "application/json",
                                 **(headers or {}),
                             },
                             data=jsonlib.dumps(data, separators=(",", ":")),
+                            timeout=REQUEST_TIMEOUT,
                         )
                     else:
-                        response = requests.post(url, headers=headers, data=data)
+                        response = session.post(
+                            url, headers=headers, data=data, timeout=REQUEST_TIMEOUT
+                        )
 
             try:
                 response.raise_for_status()
@@ -1,13 +1,15 @@
 import base64
 import hmac
 import hashlib
-import json
 import os
 import sys
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
 from typing import Any, Dict, Optional
 from app.utils.colors import color_text
+from app.utils.jsonio import dumps
+from app.utils import locale as app_locale
 from app.utils.locale import t, LANGUAGE
 from app.utils.params import STATUS_MODE
 from app.config import cfg as Config
@@ -22,36 +24,64 @@ def exit_with_status(msg: str) -> None:
     sys.exit(1)
 
 
-def decode_option_codes(option_string: str, prefer_short: bool = False):
-    """Return a list of tuples with (code, description)."""
+# model codes are part of every option string and carry no extra information
+_EXCLUDED_OPTION_CODES = frozenset({"MDL3", "MDLY", "MDLX", "MDLS"})
+
+# (translations, label); compared by identity so set_language() invalidates it
+_UNKNOWN_LABEL: Optional[tuple] = None
+
+
+def _unknown_option_label() -> str:
+    global _UNKNOWN_LABEL
+    translations = app_locale.TRANSLATIONS
+    if _UNKNOWN_LABEL is None or _UNKNOWN_LABEL[0] is not translations:
+        _UNKNOWN_LABEL = (translations, t("Unknown option code"))
+    return _UNKNOWN_LABEL[1]
+
+
+# decoded option strings; orders are decoded several times per render. Valid
+# for one label map and one "unknown" label, see _DECODE_CACHE_OWNER.
+_DECODE_CACHE: Dict[Tuple[str, bool], Tuple[Tuple[str, str], ...]] = {}
+_DECODE_CACHE_OWNER: Optional[tuple] = None
+_DECODE_CACHE_SIZE = 256
+
+
+def decode_option_codes(
+    option_string: str, prefer_short: bool = False
+) -> Tuple[Tuple[str, str], ...]:
+    """Return (code, description) pairs, sorted by code.
+
+    The result is the cached tuple itself, shared between callers.
+    """
+    global _DECODE_CACHE_OWNER
     if not isinstance(option_string, str) or not option_string:
-        return []
-
-    excluded_codes = {"MDL3", "MDLY", "MDLX", "MDLS"}
-    codes = sorted(
-        {
-            c.strip().upper()
-            for c in option_string.split(",")
-            if c.strip() and c.strip().upper() not in excluded_codes
-        }
-    )
-
-    from app.utils.option_codes import get_option_codes
-
-    option_codes = get_option_codes()
-    decoded = []
-    for code in codes:
-        entry = option_codes.get(code)
-        label = None
-        if isinstance(entry, dict):
-            if prefer_short:
-                label = entry.get("label_short") or entry.get("label")
-            else:
-                label = entry.get("label")
-        elif isinstance(entry, str):
-            # Backwards compatibility for legacy caches
-            label = entry
-        decoded.append((code, label if label else t("Unknown option code")))
+        return ()
+
+    # local import: option_codes -> connection -> helpers would be circular
+    from app.utils.option_codes import get_option_label_maps
+
+    labels, labels_short = get_option_label_maps()
+    unknown = _unknown_option_label()
+    owner = _DECODE_CACHE_OWNER
+    if owner is None or owner[0] is not labels or owner[1] != unknown:
+        _DECODE_CACHE.clear()
+        _DECODE_CACHE_OWNER = (labels, unknown)
+
+    cache_key = (option_string, prefer_short)
+    decoded = _DECODE_CACHE.get(cache_key)
+    if decoded is None:
+        codes = set()
+        add = codes.add
+        for c in option_string.split(","):
+            c = c.strip().upper()
+            if c and c not in _EXCLUDED_OPTION_CODES:
+                add(c)
+
+        get = (labels_short if prefer_short else labels).get
+        decoded = tuple((code, get(code) or unknown) for code in sorted(codes))
+        if len(_DECODE_CACHE) >= _DECODE_CACHE_SIZE:
+            _DECODE_CACHE.clear()
+        _DECODE_CACHE[cache_key] = decoded
     return decoded
 
 
@@ -91,8 +121,13 @@ def normalize_str(key: str) -> str:
 
     if not isinstance(key, str):
         return ""
-    collapsed = " ".join(key.strip().split())
-    return collapsed.lower()
+    return _normalize_key(key)
+
+
+# timeline and history code normalizes the same few dozen keys over and over
+@lru_cache(maxsize=1024)
+def _normalize_key(key: str) -> str:
+    return " ".join(key.split()).lower()
 
 
 def clean_str(value):
@@ -108,47 +143,65 @@ def pretty_print(data: Any) -> str:
     """
 
     if isinstance(data, (list, dict)):
-        return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
+        return dumps(data, indent=True, sort_keys=True)
     return str(data)
 
 
 def compare_dicts(old_dict, new_dict, path=""):
     differences = []
-    for key in old_dict:
-        if key not in new_dict:
-            differences.append(
-                {
-                    "operation": "removed",
-                    "key": path + key,
-                    "old_value": clean_str(old_dict[key]),
-                }
-            )
-        elif isinstance(old_dict[key], dict) and isinstance(new_dict[key], dict):
-            differences.extend(
-                compare_dicts(old_dict[key], new_dict[key], path + key + ".")
-            )
-        else:
-            old_value = clean_str(old_dict[key])
-            new_value = clean_str(new_dict[key])
+    # equal values (and whole equal subtrees) cannot produce a difference, and
+    # == walks nested dicts in C; most orders are unchanged between runs
+    if old_dict == new_dict:
+        return differences
+    append = differences.append
+    # Explicit stack instead of recursion. Each frame keeps its key iterator,
+    # so diffs come out in the same depth-first order as before.
+    stack = [(old_dict, new_dict, path, iter(old_dict))]
+    while stack:
+        old_level, new_level, prefix, keys = stack[-1]
+        for key in keys:
+            if key not in new_level:
+                append(
+                    {
+                        "operation": "removed",
+                        "key": prefix + key,
+                        "old_value": clean_str(old_level[key]),
+                    }
+                )
+                continue
+            old_value = old_level[key]
+            new_value = new_level[key]
+            if old_value == new_value:
+                continue
+            if isinstance(old_value, dict) and isinstance(new_value, dict):
+                stack.append(
+                    (old_value, new_value, prefix + key + ".", iter(old_value))
+                )
+                break
+            old_value = clean_str(old_value)
+            new_value = clean_str(new_value)
             if old_value != new_value:
-                differences.append(
+                append(
                     {
                         "operation": "changed",
-                        "key": path + key,
+                        "key": prefix + key,
                         "old_value": old_value,
                         "value": new_value,
                     }
                 )
-
-    for key in new_dict:
-        if key not in old_dict:
-            differences.append(
-                {
-                    "operation": "added",
-                    "key": path + key,
-                    "value": clean_str(new_dict[key]),
-                }
-            )
+        else:
+            stack.pop()
+            # set difference is done in C and is usually empty
+            if new_level.keys() - old_level.keys():
+                for key in new_level:
+                    if key not in old_level:
+                        append(
+                            {
+                                "operation": "added",
+                                "key": prefix + key,
+                                "value": clean_str(new_level[key]),
+                            }
+                        )
 
     return differences
 
@@ -170,16 +223,27 @@ def generate_token(bytes_len: int, token_length: Optional[int] = None) -> str:
     return _b32(os.urandom(bytes_len), token_length)
 
 
+# (secret_b32, keyed HMAC); copying it skips decoding and re-keying per value
+_HMAC_PROTO: Optional[tuple] = None
+
+
 def pseudonymize_data(data: str, length: int) -> str:
+    global _HMAC_PROTO
     secret_b32 = Config.get("secret")
     if not secret_b32:
         secret_b32 = generate_token(32)
         Config.set("secret", secret_b32)
-    secret = _b32decode_nopad(secret_b32)
-    digest = hmac.new(secret, data.encode("utf-8"), hashlib.sha256).digest()
-    return _b32(digest, length)
+    if _HMAC_PROTO is None or _HMAC_PROTO[0] != secret_b32:
+        secret = _b32decode_nopad(secret_b32)
+        _HMAC_PROTO = (secret_b32, hmac.new(secret, digestmod=hashlib.sha256))
+    mac = _HMAC_PROTO[1].copy()
+    mac.update(data.encode("utf-8"))
+    return _b32(mac.digest(), length)
 
 
+# the same timestamps show up in several fields and in every history entry;
+# sized so a long history of one account fits and a full render is all hits
+@lru_cache(maxsize=1024)
 def _parse_iso_timestamp(value: str) -> Optional[datetime]:
     if value is None:
         return None
@@ -188,8 +252,7 @@ def _parse_iso_timestamp(value: str) -> Optional[datetime]:
         return None
     if normalized.endswith(("Z", "z")):
         normalized = normalized[:-1] + "+00:00"
-    if "T" not in normalized and len(normalized) >= 16 and normalized[10] == " ":
-        normalized = normalized[:10] + "T" + normalized[11:]
+    # "YYYY-MM-DD HH:MM" needs no rewrite, fromisoformat accepts any separator
     try:
         dt = datetime.fromisoformat(normalized)
     except ValueError:
@@ -209,8 +272,11 @@ def format_timestamp_with_time(value: Any) -> Optional[str]:
 
 
 def get_delivery_appointment_display(tasks: Dict[str, Any]) -> Optional[str]:
-    for source in _iter_delivery_appointment_sources(tasks):
-        for key in ("appointmentDate", "appointmentDateUtc"):
+    for path in _APPOINTMENT_PATHS:
+        source = _get_nested_dict(tasks, path)
+        if source is None:
+            continue
+        for key in _APPOINTMENT_DATE_KEYS:
             formatted = format_timestamp_with_time(source.get(key))
             if formatted:
                 return formatted
@@ -252,6 +318,13 @@ DATETIME_FORMATS = {
     "pl": "%d.%m.%Y %H:%M",
 }
 
+# (date_fmt, datetime_fmt) for LANGUAGE, resolved once at import
+_FORMAT_LANG = (LANGUAGE or "en").split("_")[0]
+_ACTIVE_FORMATS = (
+    DATE_FORMATS.get(_FORMAT_LANG, "%Y-%m-%d"),
+    DATETIME_FORMATS.get(_FORMAT_LANG, "%Y-%m-%d %H:%M"),
+)
+
 
 def locale_format_datetime(value: Any) -> Optional[str]:
     if not isinstance(value, str):
@@ -259,38 +332,23 @@ def locale_format_datetime(value: Any) -> Optional[str]:
     dt = _parse_iso_timestamp(value)
     if not dt:
         return None
-    lang = (LANGUAGE or "en").split("_")[0]
-    if dt.hour == 0 and dt.minute == 0:
-        fmt = DATE_FORMATS.get(lang, "%Y-%m-%d")
-    else:
-        fmt = DATETIME_FORMATS.get(lang, "%Y-%m-%d %H:%M")
-    return dt.strftime(fmt)
-
-
-def _iter_delivery_appointment_sources(
-    tasks: Dict[str, Any],
-) -> Iterable[Dict[str, Any]]:
-    delivery_details = tasks.get("deliveryDetails")
-    if isinstance(delivery_details, dict):
-        reg_data = delivery_details.get("regData")
-        if isinstance(reg_data, dict):
-            appointment = reg_data.get("deliveryAppointment")
-            if isinstance(appointment, dict):
-                yield appointment
-        appointment = delivery_details.get("deliveryAppointment")
-        if isinstance(appointment, dict):
-            yield appointment
-
-    final_payment = tasks.get("finalPayment")
-    if isinstance(final_payment, dict):
-        payment_data = final_payment.get("data")
-        if isinstance(payment_data, dict):
-            appointment = payment_data.get("deliveryAppointment")
-            if isinstance(appointment, dict):
-                yield appointment
-
-    scheduling = tasks.get("scheduling")
-    if isinstance(scheduling, dict):
-        appointment = scheduling.get("deliveryAppointment")
-        if isinstance(appointment, dict):
-            yield appointment
+    return dt.strftime(_ACTIVE_FORMATS[1 if dt.hour or dt.minute else 0])
+
+
+# where a delivery appointment can live inside the tasks payload, in priority
+# order
+_APPOINTMENT_PATHS = (
+    ("deliveryDetails", "regData", "deliveryAppointment"),
+    ("deliveryDetails", "deliveryAppointment"),
+    ("finalPayment", "data", "deliveryAppointment"),
+    ("scheduling", "deliveryAppointment"),
+)
+_APPOINTMENT_DATE_KEYS = ("appointmentDate", "appointmentDateUtc")
+
+
+def _get_nested_dict(data: Any, path: Iterable[str]) -> Optional[Dict[str, Any]]:
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data if isinstance(data, dict) else None
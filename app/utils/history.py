@@ -57,6 +57,9 @@ HISTORY_TRANSLATIONS_IGNORED = {
     "details.tasks.tradeIn.strings.",
 }
 
+# str.startswith takes a tuple and checks every prefix in one C call
+HISTORY_IGNORED_PREFIXES = tuple(HISTORY_TRANSLATIONS_IGNORED)
+
 # Define translations for history keys
 HISTORY_TRANSLATIONS = {
     "details.tasks.scheduling.deliveryWindowDisplay": "Delivery Window",
@@ -151,9 +154,7 @@ def get_history_of_order(order_reference) -> List[Dict[str, Any]]:
             display_key = key_str
 
             if not ALL_KEYS_MODE:
-                if any(
-                    key_str.startswith(pref) for pref in HISTORY_TRANSLATIONS_IGNORED
-                ):
+                if key_str.startswith(HISTORY_IGNORED_PREFIXES):
                     continue
 
                 if not DETAILS_MODE:
@@ -200,14 +201,15 @@ def _format_value(value):
     return value
 
 
-def print_history(order_reference) -> None:
+def format_history(order_reference) -> List[str]:
+    """Return the change history block of an order as printable lines."""
     history = get_history_of_order(order_reference)
-    if history:
-        print("\n")
-        print(color_text(t("Change History") + ":", "94"))
-        for change in history:
-            msg = format_history_entry(change, change["timestamp"] == TODAY)
-            print(msg)
+    if not history:
+        return []
+    lines = ["\n", color_text(t("Change History") + ":", "94")]
+    for change in history:
+        lines.append(format_history_entry(change, change["timestamp"] == TODAY))
+    return lines
 
 
 def format_history_entry(entry, colored):
@@ -1,12 +1,13 @@
-import json
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
 
 import locale
 import os
 import sys
 from app.config import PUBLIC_DIR, SETTINGS_FILE, cfg as Config
 from app.utils.colors import color_text
+from app.utils.jsonio import loads
 
 LANG_DIR = PUBLIC_DIR / "lang"
 LOCALE = "en_US"
@@ -44,23 +45,29 @@ def _get_configured_locale() -> Optional[str]:
     return normalize_locale(configured)
 
 
+# parsed translations per language code; use_default_language switches back
+# and forth, so each file is read only once
+_TRANSLATION_CACHE: Dict[str, dict] = {}
+
+
+def _read_translation_file(path) -> dict:
+    try:
+        return loads(path.read_bytes())
+    except Exception:
+        return {}
+
+
 def _load_translations(lang: str) -> dict:
     """Load translation mappings for *lang* with English fallback."""
-    translations = {}
-    default_path = LANG_DIR / "en.json"
-    if default_path.exists():
-        try:
-            translations.update(json.loads(default_path.read_text(encoding="utf-8")))
-        except Exception:
-            pass
     lang_code = (lang or "").split("_")[0].lower()
+    cached = _TRANSLATION_CACHE.get(lang_code)
+    if cached is not None:
+        return cached
+    translations = {}
+    translations.update(_read_translation_file(LANG_DIR / "en.json"))
     if lang_code and lang_code != "en":
-        lang_path = LANG_DIR / f"{lang_code}.json"
-        if lang_path.exists():
-            try:
-                translations.update(json.loads(lang_path.read_text(encoding="utf-8")))
-            except Exception:
-                pass
+        translations.update(_read_translation_file(LANG_DIR / f"{lang_code}.json"))
+    _TRANSLATION_CACHE[lang_code] = translations
     return translations
 
 
@@ -119,11 +126,13 @@ LANG_DEFAULT_REGION = {
 
 _BCP47_RE = re.compile(r"^([a-zA-Z]{2,3})(?:[_-]([A-Za-z]{2}))?(?:\..*)?$")
 _LOCALE_STRICT_RE = re.compile(r"^[a-z]{2}_[A-Z]{2}$")
+_PAREN_RE = re.compile(r"^([A-Za-z ]+)\s*\(([^)]*)\)$")
+_WS_RE = re.compile(r"\s+")
 
 
 def _strip_encoding(tag: str) -> str:
     # 'de_AT.ISO8859-1' -> 'de_AT'
-    return tag.split(".")[0].strip()
+    return tag.partition(".")[0].strip()
 
 
 def _to_bcp47(lang: Optional[str], region: Optional[str]) -> Optional[str]:
@@ -136,7 +145,24 @@ def _to_bcp47(lang: Optional[str], region: Optional[str]) -> Optional[str]:
     return l
 
 
+def _is_ascii_alpha(text: str) -> bool:
+    return text.isascii() and text.isalpha()
+
+
 def _try_fast_bcp47(tag: str) -> Optional[str]:
+    # plain character checks for the common 'll' and 'll_RR[.enc]' shapes
+    n = len(tag)
+    if n == 2 and _is_ascii_alpha(tag):
+        return tag.lower()
+    if (
+        n >= 5
+        and tag[2] in "_-"
+        and (n == 5 or (tag[5] == "." and "\n" not in tag))
+        and _is_ascii_alpha(tag[:2])
+        and _is_ascii_alpha(tag[3:5])
+    ):
+        return f"{tag[:2].lower()}_{tag[3:5].upper()}"
+    # 3-letter language codes and the rest
     m = _BCP47_RE.match(tag)
     if not m:
         return None
@@ -150,7 +176,8 @@ def _try_locale_normalize(tag: str) -> Optional[str]:
         norm = locale.normalize(tag)
         if norm and norm not in ("C", "POSIX"):
             norm = _strip_encoding(norm)  # de_AT.ISO8859-1 → de_AT
-            # Re-check with regex to enforce ll[_]RR casing
+            # Re-check to enforce ll[_]RR casing; plain ll_RR output is
+            # handled by the character checks without touching the regex
             return _try_fast_bcp47(norm)
     except Exception:
         pass
@@ -165,7 +192,7 @@ def _try_windows_mapping(tag: str) -> Optional[str]:
     s = s.replace("-", "_")
 
     # Try patterns like 'Language (Region)'
-    m = re.match(r"^([A-Za-z ]+)\s*\(([^)]*)\)$", s)
+    m = _PAREN_RE.match(s)
     if m:
         lang_name = m.group(1).strip().lower()
         region_name = m.group(2).strip().lower()
@@ -178,7 +205,7 @@ def _try_windows_mapping(tag: str) -> Optional[str]:
         return None
 
     # Split on underscore first (Windows classic), else last run of spaces
-    parts = s.split("_") if "_" in s else re.split(r"\s+", s, maxsplit=1)
+    parts = s.split("_") if "_" in s else _WS_RE.split(s, maxsplit=1)
 
     if len(parts) == 1:
         lang_name = parts[0].strip().lower()
@@ -189,7 +216,7 @@ def _try_windows_mapping(tag: str) -> Optional[str]:
     region_name = parts[1].strip().lower()
 
     # Some inputs put extra spaces in region
-    region_name = re.sub(r"\s+", " ", region_name)
+    region_name = " ".join(region_name.split())
 
     l = WINDOWS_LANG_MAP.get(lang_name)
     r = WINDOWS_REGION_MAP.get(region_name)
@@ -201,6 +228,7 @@ def _try_windows_mapping(tag: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=64)
 def normalize_locale(code: str) -> Optional[str]:
     """Best-effort conversion to 'll' or 'll_RR'.
 
@@ -237,8 +265,20 @@ def _is_valid_locale(value: Optional[str]) -> bool:
     return bool(_LOCALE_STRICT_RE.match(value))
 
 
+_UNSET = object()
+_OS_LOCALE = _UNSET
+
+
 def get_os_locale() -> Optional[str]:
     """Return the system locale as 'll' or 'll_RR' where possible."""
+    global _OS_LOCALE
+    # the OS locale does not change while we run, detect it only once
+    if _OS_LOCALE is _UNSET:
+        _OS_LOCALE = _detect_os_locale()
+    return _OS_LOCALE
+
+
+def _detect_os_locale() -> Optional[str]:
     # 1) locale.getlocale()
     try:
         lang, _ = locale.getlocale()
@@ -259,12 +299,10 @@ def get_os_locale() -> Optional[str]:
     except Exception:
         pass
 
-    # 3) Env vars
+    # 3) Env vars, in POSIX precedence order (first usable one wins)
+    env = os.environ
     for var in ("LC_ALL", "LC_MESSAGES", "LANG", "LANGUAGE"):
-        try:
-            lang = os.environ.get(var)
-        except Exception:
-            lang = None
+        lang = env.get(var)
         if lang and lang not in ("C", "POSIX"):
             res = normalize_locale(lang)
             if res:
@@ -282,19 +320,18 @@ def init_locale() -> None:
     configured_locale = _get_configured_locale()
     if configured_locale and _is_valid_locale(configured_locale):
         LOCALE = configured_locale
-        LANGUAGE = configured_locale.split("_", 1)[0].lower()
-        COUNTRY = configured_locale.split("_", 1)[1].upper()
+        LANGUAGE, COUNTRY = configured_locale.split("_", 1)
         if _get_language_source() is None and _can_override_language("system"):
             Config.set("language_source", "system")
         return
 
-    os_locale = get_os_locale()
-    if os_locale:
-        normalized = normalize_locale(os_locale)
+    # get_os_locale() already returns normalize_locale() output
+    normalized = get_os_locale()
+    if normalized:
         if _is_valid_locale(normalized):
             LOCALE = normalized
-            LANGUAGE = normalized.split("_", 1)[0].lower()
-            COUNTRY = normalized.split("_", 1)[1].upper()
+            # _is_valid_locale guarantees the ll_RR casing
+            LANGUAGE, COUNTRY = normalized.split("_", 1)
             if not STATUS_MODE and LANGUAGE != previous_language:
                 message = (
                     f'System language detected. Using "{LANGUAGE}" '
@@ -318,6 +355,7 @@ TRANSLATIONS = _load_translations(LANGUAGE)
 
 def store_tesla_locale(locale_value: Optional[str]) -> None:
     """Persist a Tesla-provided locale as the primary language setting."""
+    global LOCALE, LANGUAGE, COUNTRY
     if not isinstance(locale_value, str) or not locale_value.strip():
         return
     previous_language = LANGUAGE
@@ -327,7 +365,12 @@ def store_tesla_locale(locale_value: Optional[str]) -> None:
     if _can_override_language("tesla"):
         Config.set("language", normalized)
         Config.set("language_source", "tesla")
-        init_locale()
+        if _is_valid_locale(normalized):
+            # same result init_locale() would derive from the new setting
+            LOCALE = normalized
+            LANGUAGE, COUNTRY = normalized.split("_", 1)
+        else:
+            init_locale()
         if not STATUS_MODE and LANGUAGE != previous_language:
             message = (
                 f'Tesla order language detected. Using "{LANGUAGE}" '
@@ -33,6 +33,7 @@ def main() -> None:
     if not MIGRATIONS_DIR.exists():
         return
     applied = set(_load_applied_migrations())
+    already_applied = len(applied)
     files = sorted(MIGRATIONS_DIR.glob("*.py"))
     for path in files:
         name = path.stem
@@ -49,4 +50,6 @@ def main() -> None:
         except Exception as e:
             # Don't hard-fail, just report
             print(f"> Migration '{name}' failed: {e}", file=sys.stderr)
-    _save_applied_migrations(list(applied))
+    # nothing new on almost every run; skip rewriting an unchanged file
+    if len(applied) != already_applied:
+        _save_applied_migrations(list(applied))
@@ -2,20 +2,45 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timedelta, timezone
-from glob import glob
-from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from app.config import PRIVATE_DIR, PUBLIC_DIR
 from app.utils.connection import request_with_retry
+from app.utils.jsonio import dumps_bytes, loads
 
 FETCH_URL = "https://www.tesla-order-status-tracker.de/get/option_codes.php"
 CACHE_FILE = PRIVATE_DIR / "option_codes_cache.json"
 CACHE_TTL = timedelta(hours=24)
 SCHEMA_VERSION = 3
 _OPTION_CODES: Optional[Dict[str, Dict[str, Any]]] = None
+# (source dict, labels, short-or-long labels), rebuilt when _OPTION_CODES changes
+_LABEL_MAPS: Optional[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]] = None
+
+
+# keys consumed by _normalize_entry; everything else is kept as "raw"
+_NORMALIZED_KEYS = frozenset(
+    {
+        "label",
+        "label_en",
+        "label_en_us",
+        "label_short",
+        "label_en_short",
+        "category",
+        "raw",
+    }
+)
+
+
+def _normalize_category(category: Any) -> Optional[str]:
+    if not isinstance(category, str):
+        return None
+    # remote categories are normally clean lowercase tokens: strip() then
+    # returns the same object and the lower() copy can be skipped
+    category = category.strip()
+    return category if category.islower() else category.lower()
 
 
 def _normalize_entry(value: Any) -> Optional[Dict[str, Any]]:
@@ -29,31 +54,18 @@ def _normalize_entry(value: Any) -> Optional[Dict[str, Any]]:
                 label = raw.get("label") or raw.get("label_en")
                 if label_short is None:
                     label_short = raw.get("label_en_short")
+        if label is None:
+            return None
         category = value.get("category")
         raw_payload = value.get("raw")
         if raw_payload is None:
             # Preserve original payload for future use if we have access to it
             raw_payload = {
-                k: v
-                for k, v in value.items()
-                if k
-                not in {
-                    "label",
-                    "label_en",
-                    "label_en_us",
-                    "label_short",
-                    "label_en_short",
-                    "category",
-                    "raw",
-                }
+                k: v for k, v in value.items() if k not in _NORMALIZED_KEYS
             } or None
-        if label is None:
-            return None
         entry = {
             "label": str(label),
-            "category": (
-                str(category).strip().lower() if isinstance(category, str) else None
-            ),
+            "category": _normalize_category(category),
         }
         if isinstance(label_short, str) and label_short.strip():
             entry["label_short"] = label_short.strip()
@@ -70,6 +82,8 @@ def _normalize_entry(value: Any) -> Optional[Dict[str, Any]]:
     }
 
 
+# the cache's fetched_at string rarely changes within a run
+@lru_cache(maxsize=8)
 def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
@@ -94,14 +108,59 @@ def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
     return dt.astimezone(timezone.utc)
 
 
-def _load_cache(allow_expired: bool = False) -> Optional[Dict[str, Dict[str, Any]]]:
-    if not CACHE_FILE.exists():
+# parsed cache file keyed by (st_mtime_ns, st_size); a cold start can load
+# the cache twice (fresh, then expired as fallback) and should parse it once
+_CACHE_MEMO: Dict[str, Any] = {}
+
+
+def _read_cache_payload() -> Optional[Any]:
+    try:
+        st = CACHE_FILE.stat()
+    except OSError:
         return None
+    key = (st.st_mtime_ns, st.st_size)
+    if _CACHE_MEMO.get("key") == key:
+        return _CACHE_MEMO["payload"]
     try:
-        with CACHE_FILE.open("r", encoding="utf-8") as fh:
-            payload = json.load(fh)
+        payload = loads(CACHE_FILE.read_bytes())
     except (OSError, ValueError):
         return None
+    _CACHE_MEMO.clear()
+    _CACHE_MEMO.update(key=key, payload=payload)
+    return payload
+
+
+def _normalize_cached_codes(
+    option_codes: Dict[str, Any], current_schema: bool
+) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+    """Return ``(normalized, entries_stale)`` for the cached option codes."""
+    if current_schema:
+        # _write_cache stores entries already normalized for this schema
+        normalized = {
+            str(code).strip().upper(): value
+            for code, value in option_codes.items()
+            if isinstance(value, dict) and isinstance(value.get("label"), str)
+        }
+        return normalized, len(normalized) != len(option_codes)
+
+    normalized = {}
+    entries_stale = False
+    for code, value in option_codes.items():
+        key = str(code).strip().upper()
+        entry = _normalize_entry(value)
+        if entry:
+            normalized[key] = entry
+            if not isinstance(value, dict):
+                entries_stale = True
+        else:
+            entries_stale = True
+    return normalized, entries_stale
+
+
+def _load_cache(allow_expired: bool = False) -> Optional[Dict[str, Dict[str, Any]]]:
+    payload = _read_cache_payload()
+    if payload is None:
+        return None
 
     option_codes = payload.get("option_codes")
     if not isinstance(option_codes, dict):
@@ -117,18 +176,14 @@ def _load_cache(allow_expired: bool = False) -> Optional[Dict[str, Dict[str, Any
         if datetime.now(timezone.utc) - fetched_at > CACHE_TTL:
             return None
 
-    normalized: Dict[str, Dict[str, Any]] = {}
-    for code, value in option_codes.items():
-        key = str(code).strip().upper()
-        entry = _normalize_entry(value)
-        if entry:
-            normalized[key] = entry
-            if not isinstance(value, dict):
-                requires_refresh = True
-        else:
-            requires_refresh = True
+    memo = _CACHE_MEMO.get("normalized")
+    if memo is None:
+        memo = _CACHE_MEMO["normalized"] = _normalize_cached_codes(
+            option_codes, current_schema=not requires_refresh
+        )
+    normalized, entries_stale = memo
 
-    if requires_refresh and not allow_expired:
+    if (requires_refresh or entries_stale) and not allow_expired:
         return None
 
     return normalized
@@ -143,9 +198,10 @@ def _write_cache(
         "option_codes": option_codes,
         "schema_version": SCHEMA_VERSION,
     }
-    CACHE_FILE.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    # write-then-rename so an interrupted run never leaves a truncated cache
+    tmp = CACHE_FILE.with_suffix(CACHE_FILE.suffix + ".tmp")
+    tmp.write_bytes(dumps_bytes(payload, indent=True))
+    tmp.replace(CACHE_FILE)
 
 
 def _fetch_remote() -> Tuple[Optional[Dict[str, Dict[str, Any]]], Optional[str]]:
@@ -175,9 +231,7 @@ def _fetch_remote() -> Tuple[Optional[Dict[str, Dict[str, Any]]], Optional[str]]
         category = entry.get("category")
         normalized_entry = {
             "label": str(label),
-            "category": (
-                str(category).strip().lower() if isinstance(category, str) else None
-            ),
+            "category": _normalize_category(category),
             "raw": entry,
         }
         if isinstance(label_short, str) and label_short.strip():
@@ -191,13 +245,13 @@ def _fetch_remote() -> Tuple[Optional[Dict[str, Dict[str, Any]]], Optional[str]]
 def _load_local_overrides() -> Dict[str, Dict[str, Any]]:
     folder = PUBLIC_DIR / "option-codes"
     option_codes: Dict[str, Dict[str, Any]] = {}
-    if not folder.exists() or not folder.is_dir():
+    if not folder.is_dir():
         return option_codes
 
-    for path in sorted(glob(str(folder / "*.json"))):
+    # key=str keeps the previous (case-sensitive) file precedence on Windows
+    for path in sorted(folder.glob("*.json"), key=str):
         try:
-            with Path(path).open("r", encoding="utf-8") as fh:
-                payload = json.load(fh)
+            payload = loads(path.read_bytes())
         except (OSError, ValueError):
             continue
         if isinstance(payload, dict):
@@ -211,13 +265,20 @@ def _load_local_overrides() -> Dict[str, Dict[str, Any]]:
 
 def _apply_local_overrides(
     option_codes: Dict[str, Dict[str, Any]],
+    in_place: bool = False,
 ) -> Dict[str, Dict[str, Any]]:
+    """Merge local overrides into *option_codes*.
+
+    Pass ``in_place=True`` only for a dict the caller owns (a fresh remote
+    fetch); dicts from ``_load_cache`` are shared with its memo and are copied.
+    """
     overrides = _load_local_overrides()
     if not overrides:
         return option_codes
-    merged = option_codes.copy()
-    merged.update(overrides)
-    return merged
+    if in_place:
+        option_codes.update(overrides)
+        return option_codes
+    return {**option_codes, **overrides}
 
 
 def get_option_codes(force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
@@ -237,7 +298,7 @@ def get_option_codes(force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
     option_codes, fetched_at = _fetch_remote()
     if option_codes is not None:
         _write_cache(option_codes, fetched_at)
-        final_codes = _apply_local_overrides(option_codes)
+        final_codes = _apply_local_overrides(option_codes, in_place=True)
         _OPTION_CODES = final_codes
         return final_codes
 
@@ -252,6 +313,40 @@ def get_option_codes(force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
     return fallback
 
 
+def _build_label_maps(
+    option_codes: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    labels: Dict[str, Any] = {}
+    labels_short: Dict[str, Any] = {}
+    for code, entry in option_codes.items():
+        if isinstance(entry, dict):
+            label = entry.get("label")
+            short = entry.get("label_short") or label
+        elif isinstance(entry, str):
+            # Backwards compatibility for legacy caches
+            label = short = entry
+        else:
+            continue
+        if label:
+            labels[code] = label
+        if short:
+            labels_short[code] = short
+    return labels, labels_short
+
+
+def get_option_label_maps() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return ``(labels, labels_short)`` dicts keyed by option code.
+
+    ``labels_short`` falls back to the long label where no short one exists.
+    Only codes with a non-empty label are included.
+    """
+    global _LABEL_MAPS
+    option_codes = get_option_codes()
+    if _LABEL_MAPS is None or _LABEL_MAPS[0] is not option_codes:
+        _LABEL_MAPS = (option_codes, *_build_label_maps(option_codes))
+    return _LABEL_MAPS[1], _LABEL_MAPS[2]
+
+
 def get_option_label(code: str) -> Optional[str]:
     """Return the label for *code* if it exists."""
     if not isinstance(code, str):
@@ -262,20 +357,24 @@ def get_option_label(code: str) -> Optional[str]:
     return entry.get("label")
 
 
-def get_option_entry(code: str) -> Optional[Dict[str, Any]]:
-    """Return the normalized option-code entry if available."""
+def get_option_entry(code: str) -> Optional[Mapping[str, Any]]:
+    """Return a read-only view of the normalized option-code entry."""
     if not isinstance(code, str):
         return None
     entry = get_option_codes().get(code.strip().upper())
     if entry is None:
         return None
-    # Return a shallow copy to prevent accidental mutations of the cache
-    return dict(entry)
+    # Read-only view instead of a copy; callers that need to modify the
+    # entry can still call dict() on it
+    return MappingProxyType(entry)
 
 
 def get_option_category(code: str) -> Optional[str]:
     """Return the normalized category for *code*."""
-    entry = get_option_entry(code)
+    if not isinstance(code, str):
+        return None
+    # read the field directly; get_option_entry would copy the whole entry
+    entry = get_option_codes().get(code.strip().upper())
     if not entry:
         return None
     return entry.get("category")
@@ -1,11 +1,13 @@
-import io
-import json
+import atexit
 import os
 import re
 import sys
+import threading
 import uuid
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from typing import (
     Any,
     Dict,
@@ -17,13 +19,6 @@ from typing import (
     OrderedDict as TypingOrderedDict,
 )
 
-try:
-    import pyperclip
-
-    HAS_PYPERCLIP = True
-except ImportError:
-    HAS_PYPERCLIP = False
-
 from app.config import (
     ORDERS_FILE,
     TESLA_STORES,
@@ -38,7 +33,8 @@ from app.config import (
     cfg as Config,
 )
 from app.utils.colors import color_text, strip_color
-from app.utils.connection import request_with_retry
+from app.utils.connection import REQUEST_TIMEOUT, request_with_retry
+from app.utils.jsonio import dumps_bytes, loads
 from app.utils.helpers import (
     decode_option_codes,
     get_date_from_timestamp,
@@ -49,10 +45,10 @@ from app.utils.helpers import (
     pseudonymize_data,
 )
 from app.utils.history import (
-    HISTORY_TRANSLATIONS_IGNORED,
+    HISTORY_IGNORED_PREFIXES,
     load_history_from_file,
     save_history_to_file,
-    print_history,
+    format_history,
 )
 from app.utils.locale import (
     t,
@@ -71,12 +67,38 @@ from app.utils.params import (
     ALL_KEYS_MODE,
     ORDER_FILTER,
 )
-from app.utils.timeline import print_timeline
+from app.utils.timeline import format_timeline
 from app.utils.option_codes import get_option_entry
 
 DetailedOrder = Dict[str, Any]
 OrderMap = TypingOrderedDict[str, DetailedOrder]
 
+# one comma-separated token that is a valid option code once stripped
+_OPTION_CODE_RE = re.compile(r"(?:^|,)\s*([A-Z0-9]+)\s*(?=,|\Z)")
+_MODEL_CONFIG_RE = re.compile(r"(Model [YSX3]).*?((?:AWD|RWD) (?:LR|SR|P)).*?$")
+_MODEL_OPTIONAL_CONFIG_RE = re.compile(
+    r"(Model [YSX3])(?:.*?((?:AWD|RWD) (?:LR|SR|P)))?.*?$"
+)
+_MODEL_RE = re.compile(r"(Model [YSX3]).*$")
+_WHEEL_SIZE_RE = re.compile(r"\b(\d{2})\s*\"")
+
+_UNSET = object()
+_PYPERCLIP: Any = _UNSET
+
+
+def _get_pyperclip() -> Any:
+    """Return the pyperclip module, or None when it is not installed."""
+    global _PYPERCLIP
+    # imported on first use: the clipboard is off by default and pyperclip
+    # probes for platform backends while it loads
+    if _PYPERCLIP is _UNSET:
+        try:
+            import pyperclip
+        except ImportError:
+            pyperclip = None
+        _PYPERCLIP = pyperclip
+    return _PYPERCLIP
+
 
 def _tag_changes(reference: str, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     tagged: List[Dict[str, Any]] = []
@@ -109,7 +131,7 @@ def _has_status_relevant_changes(changes: List[Dict[str, Any]]) -> bool:
         key = change.get("key")
         if not isinstance(key, str):
             return True
-        if not any(key.startswith(prefix) for prefix in HISTORY_TRANSLATIONS_IGNORED):
+        if not key.startswith(HISTORY_IGNORED_PREFIXES):
             return True
     return False
 
@@ -199,39 +221,34 @@ def _extract_reference_number(entry: Any) -> Optional[str]:
 def _order_sort_key(item: Tuple[str, DetailedOrder]) -> Tuple[str, str]:
     """Return a tuple for ordering items newest-first based on booking date."""
     reference, detailed_order = item
-    tasks = detailed_order.get("details", {}).get("tasks", {})
-    registration = tasks.get("registration", {})
-    order_details = registration.get("orderDetails", {})
-    booked_date = (
-        order_details.get("orderBookedDate")
-        or order_details.get("orderPlacedDate")
-        or ""
-    )
+    # the path is present on real orders; walk it directly instead of
+    # allocating a {} default at every level
+    try:
+        order_details = detailed_order["details"]["tasks"]["registration"][
+            "orderDetails"
+        ]
+        booked_date = (
+            order_details.get("orderBookedDate")
+            or order_details.get("orderPlacedDate")
+            or ""
+        )
+    except (KeyError, TypeError, AttributeError):
+        booked_date = ""
     return (booked_date, reference)
 
 
-def _normalize_option_code(raw_code: str) -> str:
-    """Return a sanitized option code matching server expectations."""
-    if not isinstance(raw_code, str):
-        return ""
-    trimmed = raw_code.strip().upper()
-    if not trimmed or not re.fullmatch(r"[A-Z0-9]+", trimmed):
-        return ""
-    return trimmed[:32]
-
-
 def _collect_option_codes(orders: List[dict]) -> List[str]:
     """Extract unique option codes from orders."""
-    codes = set()
+    parts = []
     for order in orders:
         order_data = order.get("order", {}) if isinstance(order, dict) else {}
         raw_options = order_data.get("mktOptions")
         if isinstance(raw_options, str):
-            for part in raw_options.split(","):
-                normalized = _normalize_option_code(part)
-                if normalized:
-                    codes.add(normalized)
-    return sorted(codes)
+            parts.append(raw_options)
+    # upper() maps characters one by one, so one call on the joined string
+    # matches upper-casing each code on its own
+    combined = ",".join(parts).upper()
+    return sorted({code[:32] for code in _OPTION_CODE_RE.findall(combined)})
 
 
 def enumerate_orders(
@@ -248,13 +265,33 @@ def enumerate_orders(
         yield index, reference, detailed_order
 
 
+# matches pool_maxsize of the shared session in app.utils.connection
+_DETAIL_FETCH_WORKERS = 4
+
+
+def _retrieve_all_order_details(order_ids: List[str], access_token) -> List[Any]:
+    """Fetch the task details of every order, in parallel, in input order."""
+    if len(order_ids) <= 1:
+        return [
+            _retrieve_order_details(order_id, access_token) for order_id in order_ids
+        ]
+    workers = min(_DETAIL_FETCH_WORKERS, len(order_ids))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                partial(_retrieve_order_details, access_token=access_token),
+                order_ids,
+            )
+        )
+
+
 def _get_all_orders(access_token):
     orders = _retrieve_orders(access_token)
+    order_ids = [order["referenceNumber"] for order in orders]
+    all_details = _retrieve_all_order_details(order_ids, access_token)
 
     new_orders: OrderedDict[str, DetailedOrder] = OrderedDict()
-    for order in orders:
-        order_id = order["referenceNumber"]
-        order_details = _retrieve_order_details(order_id, access_token)
+    for order, order_id, order_details in zip(orders, order_ids, all_details):
 
         if not order_details or not order_details.get("tasks"):
             exit_with_status(
@@ -311,8 +348,7 @@ def _store_tesla_locale_from_orders(orders: List[Dict[str, Any]]) -> None:
 
 def _save_orders_to_file(orders):
     serializable_orders = _ensure_order_map(orders)
-    with open(ORDERS_FILE, "w") as f:
-        json.dump(serializable_orders, f)
+    ORDERS_FILE.write_bytes(dumps_bytes(serializable_orders))
     if not STATUS_MODE:
         print(
             color_text(t("> Orders saved to '{file}'").format(file=ORDERS_FILE), "94")
@@ -320,32 +356,43 @@ def _save_orders_to_file(orders):
 
 
 def _load_orders_from_file():
-    if os.path.exists(ORDERS_FILE):
-        with open(ORDERS_FILE, "r") as f:
-            orders = _ensure_order_map(json.load(f))
-        _store_tesla_locale_from_orders(list(orders.values()))
-        return orders
-    return OrderedDict()
+    try:
+        raw = ORDERS_FILE.read_bytes()
+    except FileNotFoundError:
+        return OrderedDict()
+    orders = _ensure_order_map(loads(raw))
+    _store_tesla_locale_from_orders(list(orders.values()))
+    return orders
+
+
+_MISSING = object()
 
 
 def _compare_orders(old_orders, new_orders):
     old_map = _ensure_order_map(old_orders)
     new_map = _ensure_order_map(new_orders)
     differences = []
+    matched = 0
     for reference, old_order in old_map.items():
-        if reference in new_map:
-            changes = compare_dicts(old_order, new_map[reference], path="")
+        new_order = new_map.get(reference, _MISSING)
+        if new_order is not _MISSING:
+            matched += 1
+            changes = compare_dicts(old_order, new_order, path="")
             differences.extend(_tag_changes(reference, changes))
         else:
             differences.append(
                 {"operation": "removed", "order_reference": reference, "key": ""}
             )
 
-    for reference in new_map:
-        if reference not in old_map:
-            differences.append(
-                {"operation": "added", "order_reference": reference, "key": ""}
-            )
+    # every new reference was already seen in old_map, nothing was added
+    if matched == len(new_map):
+        return differences
+    # walk new_map (not a key-set difference) to keep the output order stable
+    differences.extend(
+        {"operation": "added", "order_reference": reference, "key": ""}
+        for reference in new_map
+        if reference not in old_map
+    )
     return differences
 
 
@@ -365,9 +412,7 @@ def get_model_from_order(detailed_order) -> str:
             # Extract model name and configuration suffix using regex
             # Model Y Long Range Dual Motor - AWD LR (Juniper) => Model Y - AWD LR
             # Model S Plaid => Model S Plaid
-            match = re.match(
-                r"(Model [YSX3]).*?((?:AWD|RWD) (?:LR|SR|P)).*?$", description
-            )
+            match = _MODEL_CONFIG_RE.match(description)
             if match:
                 model_name = match.group(1)
                 config_suffix = match.group(2)
@@ -376,7 +421,7 @@ def get_model_from_order(detailed_order) -> str:
                 break
             else:
                 # If first group matches but second doesn't, use full description
-                match = re.match(r"(Model [YSX3]).*$", description)
+                match = _MODEL_RE.match(description)
                 if match:
                     model = description.strip()
                     break
@@ -384,12 +429,13 @@ def get_model_from_order(detailed_order) -> str:
     return model
 
 
-def _render_share_output(detailed_orders):
-    order_items = list(enumerate_orders(detailed_orders))
-    total_orders = len(order_items)
+def _render_share_output(detailed_orders) -> List[str]:
+    out: List[str] = []
+    order_map = _ensure_order_map(detailed_orders)
+    total_orders = len(order_map)
     share_separator = "=" * 60
 
-    for idx, (_, order_reference, detailed_order) in enumerate(order_items, start=1):
+    for idx, (order_reference, detailed_order) in enumerate(order_map.items(), start=1):
         order = detailed_order["order"]
         order_details = detailed_order["details"]
         tasks = order_details.get("tasks", {})
@@ -400,7 +446,7 @@ def _render_share_output(detailed_orders):
             header = f"#{idx} {t('Order Details')}:"
         else:
             header = f"{t('Order Details')}:"
-        print(color_text(header, "94"))
+        out.append(color_text(header, "94"))
 
         model = paint = interior = wheels = "Unknown"
         wheel_sizes = set()
@@ -419,7 +465,7 @@ def _render_share_output(detailed_orders):
                 )
 
                 if cleaned_description and code.startswith("W"):
-                    size_match = re.search(r"\b(\d{2})\s*\"", cleaned_description)
+                    size_match = _WHEEL_SIZE_RE.search(cleaned_description)
                     if size_match:
                         wheel_sizes.add(f'{size_match.group(1)}"')
 
@@ -449,10 +495,7 @@ def _render_share_output(detailed_orders):
                     if label_short and display_label:
                         model = display_label
                     else:
-                        match = re.match(
-                            r"(Model [YSX3])(?:.*?((?:AWD|RWD) (?:LR|SR|P)))?.*?$",
-                            cleaned_description,
-                        )
+                        match = _MODEL_OPTIONAL_CONFIG_RE.match(cleaned_description)
                         if match:
                             model_name = match.group(1)
                             config_suffix = match.group(2)
@@ -467,34 +510,33 @@ def _render_share_output(detailed_orders):
             msg = f"{model} / {paint} / {interior}"
             if wheels != "Unknown":
                 msg = f"{msg} / {wheels}"
-            print(f"- {msg}")
+            out.append(f"- {msg}")
 
         if scheduling.get("deliveryAddressTitle"):
-            print(f"- {scheduling.get('deliveryAddressTitle')}")
+            out.append(f"- {scheduling.get('deliveryAddressTitle')}")
 
-        print_timeline(order_reference, detailed_order)
+        out.extend(format_timeline(order_reference, detailed_order))
 
         if idx < total_orders:
-            print(f"\n{share_separator}\n")
+            out.append(f"\n{share_separator}\n")
         else:
-            print()
+            out.append("")
+
+    return out
 
 
 def generate_share_output(detailed_orders):
     original_share_mode = history_module.SHARE_MODE
     history_module.SHARE_MODE = True
-    output_capture = io.StringIO()
-    original_stdout = sys.stdout
-    sys.stdout = output_capture
     try:
         with use_default_language():
-            _render_share_output(detailed_orders)
-
+            lines = _render_share_output(detailed_orders)
     finally:
-        sys.stdout = original_stdout
         history_module.SHARE_MODE = original_share_mode
+    share_output = "\n".join(lines) + "\n" if lines else ""
 
-    if HAS_PYPERCLIP and COPY_TO_CLIPBOARD:
+    clipboard = _get_pyperclip() if COPY_TO_CLIPBOARD else None
+    if clipboard is not None:
         # Create advertising text but don't print it
         ad_text = (
             f"{strip_color('Do you want to share your data and compete with others?')}\n"
@@ -502,13 +544,11 @@ def generate_share_output(detailed_orders):
         )
 
         if INFO_CLIPBOARD_AD:
-            pyperclip.copy(
-                "```yaml\n" + strip_color(output_capture.getvalue()) + ad_text + "\n```"
-            )
+            clipboard.copy("```yaml\n" + strip_color(share_output) + ad_text + "\n```")
         else:
-            pyperclip.copy("```yaml\n" + strip_color(output_capture.getvalue()) + "```")
+            clipboard.copy("```yaml\n" + strip_color(share_output) + "```")
 
-    return output_capture.getvalue()
+    return share_output
 
 
 def display_orders_SHARE_MODE(detailed_orders):
@@ -516,16 +556,72 @@ def display_orders_SHARE_MODE(detailed_orders):
     print(share_output, end="")
 
 
+def _get_store(location_id: Any) -> Dict[str, Any]:
+    """Look up a Tesla location by routing id (TESLA_STORES is keyed by str)."""
+    if location_id is None:
+        return {}
+    if not isinstance(location_id, str):
+        location_id = str(location_id)
+    return TESLA_STORES.get(location_id) or {}
+
+
 def display_orders(detailed_orders):
-    if HAS_PYPERCLIP:
+    # static labels, translated and colored once instead of once per order
+    labels = {
+        key: color_text(t(key) + ":", "94")
+        for key in (
+            "Order Details",
+            "Configuration",
+            "Vehicle Status",
+            "Delivery Information",
+            "Address",
+            "City",
+            "Postal Code",
+            "Phone",
+            "Email",
+            "Financing Information",
+        )
+    }
+    items = {
+        key: color_text("- " + t(key) + ":", "94")
+        for key in (
+            "Order ID",
+            "Status",
+            "VIN",
+            "Vehicle Odometer",
+            "Routing Location",
+            "Delivery Center",
+            "ETA to Delivery Center",
+            "Delivery Appointment Date",
+            "Delivery Window",
+            "Payment Type",
+            "Amount Paid",
+            "Payment Method",
+            "Account Balance",
+            "Amount Due",
+            "Finance Product",
+            "Finance Partner",
+            "Monthly Payment",
+            "Term (months)",
+            "Interest Rate",
+            "Range per Year",
+            "Financed Amount",
+            "Approved Amount",
+        )
+    }
+
+    # the share render only feeds the clipboard here, skip it when unused
+    if COPY_TO_CLIPBOARD and _get_pyperclip() is not None:
         generate_share_output(detailed_orders)
 
+    # one write for the whole block instead of a print() call per line
+    out: List[str] = []
     separator = "=" * 45
     for order_number, order_reference, detailed_order in enumerate_orders(
         detailed_orders
     ):
         prefix = "\n" if order_number == 0 else "\n\n"
-        print(f"{prefix}{separator}")
+        out.append(f"{prefix}{separator}")
         order = detailed_order["order"]
         order_details = detailed_order["details"]
         tasks = order_details.get("tasks", {})
@@ -534,171 +630,132 @@ def display_orders(detailed_orders):
         order_info = registration_data.get("orderDetails", {})
         final_payment_data = tasks.get("finalPayment", {}).get("data", {})
 
-        print(f"{color_text(t('Order Details') + ':', '94')}")
-        print(
-            f"{color_text('- ' + t('Order ID') + ':', '94')} {order['referenceNumber']}"
-        )
-        print(f"{color_text('- ' + t('Status') + ':', '94')} {order['orderStatus']}")
-        print(
-            f"{color_text('- ' + t('VIN') + ':', '94')} {order.get('vin', t('Unknown'))}"
-        )
+        out.append(labels["Order Details"])
+        out.append(f"{items['Order ID']} {order['referenceNumber']}")
+        out.append(f"{items['Status']} {order['orderStatus']}")
+        out.append(f"{items['VIN']} {order.get('vin', t('Unknown'))}")
 
         decoded_options = decode_option_codes(order.get("mktOptions", ""))
         if decoded_options:
-            print(f"\n{color_text(t('Configuration') + ':', '94')}")
+            out.append(f"\n{labels['Configuration']}")
             for code, description in decoded_options:
-                print(f"{color_text(f'- {code}:', '94')} {description}")
+                out.append(f"{color_text(f'- {code}:', '94')} {description}")
 
         odometer = order_info.get("vehicleOdometer")
         odometer_type = order_info.get("vehicleOdometerType")
         if odometer is not None and odometer != 30 and odometer_type is not None:
-            print(f"\n{color_text(t('Vehicle Status') + ':', '94')}")
-            print(
-                f"{color_text('- ' + t('Vehicle Odometer') + ':', '94')} {odometer} {odometer_type}"
-            )
+            out.append(f"\n{labels['Vehicle Status']}")
+            out.append(f"{items['Vehicle Odometer']} {odometer} {odometer_type}")
 
-        print(f"\n{color_text(t('Delivery Information') + ':', '94')}")
+        out.append(f"\n{labels['Delivery Information']}")
         location_id = order_info.get("vehicleRoutingLocation")
-        store = TESLA_STORES.get(
-            str(location_id) if location_id is not None else "", {}
-        )
+        store = _get_store(location_id)
         if store:
-            print(
-                f"{color_text('- ' + t('Routing Location') + ':', '94')} {store['display_name']} ({location_id or t('Unknown')})"
+            out.append(
+                f"{items['Routing Location']} {store['display_name']} ({location_id or t('Unknown')})"
             )
             if DETAILS_MODE:
                 address = store.get("address", {})
-                print(
-                    f"    {color_text(t('Address') + ':', '94')} {address.get('address_1', t('Unknown'))}"
+                out.append(
+                    f"    {labels['Address']} {address.get('address_1', t('Unknown'))}"
                 )
-                print(
-                    f"    {color_text(t('City') + ':', '94')} {address.get('city', t('Unknown'))}"
-                )
-                print(
-                    f"    {color_text(t('Postal Code') + ':', '94')} {address.get('postal_code', t('Unknown'))}"
+                out.append(f"    {labels['City']} {address.get('city', t('Unknown'))}")
+                out.append(
+                    f"    {labels['Postal Code']} {address.get('postal_code', t('Unknown'))}"
                 )
                 if store.get("phone"):
-                    print(f"    {color_text(t('Phone') + ':', '94')} {store['phone']}")
+                    out.append(f"    {labels['Phone']} {store['phone']}")
                 if store.get("store_email"):
-                    print(
-                        f"    {color_text(t('Email') + ':', '94')} {store['store_email']}"
-                    )
+                    out.append(f"    {labels['Email']} {store['store_email']}")
             else:
-                print(
+                out.append(
                     f"    {color_text(t('More Information in --details mode'), '94')}"
                 )
         else:
-            print(
-                f"{color_text('- ' + t('Delivery Center') + ':', '94')} {scheduling.get('deliveryAddressTitle', 'N/A')}"
+            out.append(
+                f"{items['Delivery Center']} {scheduling.get('deliveryAddressTitle', 'N/A')}"
             )
 
         eta_value = final_payment_data.get("etaToDeliveryCenter")
         if eta_value:
             formatted_eta = locale_format_datetime(eta_value) or eta_value
-            print(
-                f"{color_text('- ' + t('ETA to Delivery Center') + ':', '94')} {formatted_eta}"
-            )
+            out.append(f"{items['ETA to Delivery Center']} {formatted_eta}")
         appointment_iso = get_delivery_appointment_display(tasks)
         appointment_localized = (
             locale_format_datetime(appointment_iso) if appointment_iso else None
         )
         appointment_raw = scheduling.get("deliveryAppointmentDate")
         if appointment_localized:
-            print(
-                f"{color_text('- ' + t('Delivery Appointment Date') + ':', '94')} {appointment_localized}"
-            )
+            out.append(f"{items['Delivery Appointment Date']} {appointment_localized}")
         elif isinstance(appointment_raw, str) and appointment_raw.strip():
             condensed = " ".join(appointment_raw.split())
             fallback = locale_format_datetime(condensed) or condensed
-            print(
-                f"{color_text('- ' + t('Delivery Appointment Date') + ':', '94')} {fallback}"
-            )
+            out.append(f"{items['Delivery Appointment Date']} {fallback}")
         else:
-            print(
-                f"{color_text('- ' + t('Delivery Window') + ':', '94')} {scheduling.get('deliveryWindowDisplay', t('Unknown'))}"
+            out.append(
+                f"{items['Delivery Window']} {scheduling.get('deliveryWindowDisplay', t('Unknown'))}"
             )
 
         if DETAILS_MODE:
-            print(f"\n{color_text(t('Financing Information') + ':', '94')}")
+            out.append(f"\n{labels['Financing Information']}")
             financing_details = final_payment_data.get("financingDetails") or {}
             order_type = financing_details.get("orderType")
             tesla_finance_details = financing_details.get("teslaFinanceDetails") or {}
 
             # Handle cash purchases where no financing data is present
             if order_type == "CASH" or not final_payment_data.get("financingIntent"):
-                print(f"{color_text('- ' + t('Payment Type') + ':', '94')} {t('Cash')}")
+                out.append(f"{items['Payment Type']} {t('Cash')}")
                 payment_details = final_payment_data.get("paymentDetails") or []
                 if payment_details:
                     first_payment = payment_details[0]
                     amount_paid = first_payment.get("amountPaid", "N/A")
                     payment_type = first_payment.get("paymentType", "N/A")
-                    print(
-                        f"{color_text('- ' + t('Amount Paid') + ':', '94')} {amount_paid}"
-                    )
-                    print(
-                        f"{color_text('- ' + t('Payment Method') + ':', '94')} {payment_type}"
-                    )
+                    out.append(f"{items['Amount Paid']} {amount_paid}")
+                    out.append(f"{items['Payment Method']} {payment_type}")
                 account_balance = final_payment_data.get("accountBalance")
                 if account_balance is not None:
-                    print(
-                        f"{color_text('- ' + t('Account Balance') + ':', '94')} {account_balance}"
-                    )
+                    out.append(f"{items['Account Balance']} {account_balance}")
                 amount_due = final_payment_data.get("amountDue")
                 if amount_due is not None:
-                    print(
-                        f"{color_text('- ' + t('Amount Due') + ':', '94')} {amount_due}"
-                    )
+                    out.append(f"{items['Amount Due']} {amount_due}")
             else:
                 finance_product = financing_details.get("financialProductType", "N/A")
-                print(
-                    f"{color_text('- ' + t('Finance Product') + ':', '94')} {finance_product}"
-                )
+                out.append(f"{items['Finance Product']} {finance_product}")
                 finance_partner = tesla_finance_details.get("financePartnerName", "N/A")
-                print(
-                    f"{color_text('- ' + t('Finance Partner') + ':', '94')} {finance_partner}"
-                )
+                out.append(f"{items['Finance Partner']} {finance_partner}")
                 monthly_payment = tesla_finance_details.get("monthlyPayment")
                 if monthly_payment is not None:
-                    print(
-                        f"{color_text('- ' + t('Monthly Payment') + ':', '94')} {monthly_payment}"
-                    )
+                    out.append(f"{items['Monthly Payment']} {monthly_payment}")
                 term_months = tesla_finance_details.get("termsInMonths")
                 if term_months is not None:
-                    print(
-                        f"{color_text('- ' + t('Term (months)') + ':', '94')} {term_months}"
-                    )
+                    out.append(f"{items['Term (months)']} {term_months}")
                 interest_rate = tesla_finance_details.get("interestRate")
                 if interest_rate is not None:
-                    print(
-                        f"{color_text('- ' + t('Interest Rate') + ':', '94')} {interest_rate} %"
-                    )
+                    out.append(f"{items['Interest Rate']} {interest_rate} %")
                 mileage = tesla_finance_details.get("mileage")
                 if mileage is not None:
-                    print(
-                        f"{color_text('- ' + t('Range per Year') + ':', '94')} {mileage}"
-                    )
+                    out.append(f"{items['Range per Year']} {mileage}")
                 financed_amount = final_payment_data.get("amountDueFinancier")
                 if financed_amount is not None:
-                    print(
-                        f"{color_text('- ' + t('Financed Amount') + ':', '94')} {financed_amount}"
-                    )
+                    out.append(f"{items['Financed Amount']} {financed_amount}")
                 approved_amount = tesla_finance_details.get("approvedLoanAmount")
                 if approved_amount is not None:
-                    print(
-                        f"{color_text('- ' + t('Approved Amount') + ':', '94')} {approved_amount}"
-                    )
+                    out.append(f"{items['Approved Amount']} {approved_amount}")
 
-        print(f"{'-'*45}")
+        out.append(f"{'-'*45}")
 
-        print_timeline(order_reference, detailed_order)
+        out.extend(format_timeline(order_reference, detailed_order))
 
-        print_history(order_reference)
+        out.extend(format_history(order_reference))
+
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def print_bottom_line() -> None:
     print(f"\n{color_text(t('BOTTOM LINE HELP'), '94')}")
     # Inform user about clipboard status
-    if HAS_PYPERCLIP and COPY_TO_CLIPBOARD:
+    if COPY_TO_CLIPBOARD and _get_pyperclip() is not None:
         print(f"\n{color_text(t('BOTTOM LINE TEXT IN CLIPBOARD'), '93')}")
     elif COPY_TO_CLIPBOARD is False:
         # print(f"\n{color_text(t('BOTTOM LINE CLIPBOARD NOT WORKING'), '91')}")
@@ -821,6 +878,10 @@ def main(access_token) -> None:
         _display_selected_orders(new_orders)
 
 
+# seconds: request_with_retry sleeps 1 s and 2 s between its three attempts
+_TELEMETRY_JOIN_TIMEOUT = 1 + 2 + sum(REQUEST_TIMEOUT)
+
+
 def track_usage(orders: List[dict]) -> None:
     if not orders:
         user_orders = []
@@ -855,13 +916,30 @@ def track_usage(orders: List[dict]) -> None:
     }
 
     if option_codes:
-        try:
-            request_with_retry(
-                OPTION_CODES_URL,
-                json={"codes": option_codes},
-                max_retries=3,
-                exit_on_error=False,
-            )
-        except Exception:
-            # Swallow errors to keep endpoint stable
-            pass
+        # the payload is built above, on the caller's thread; only the POST
+        # runs in the background so it overlaps with fetching and display
+        thread = threading.Thread(
+            target=_send_option_codes,
+            args=(option_codes,),
+            name="telemetry",
+            daemon=True,
+        )
+        thread.start()
+        # bounded wait at exit: the retry back-off plus one request timeout
+        atexit.register(thread.join, _TELEMETRY_JOIN_TIMEOUT)
+        # atexit runs last-in first-out: save settings before waiting on the
+        # tracker instead of behind it
+        atexit.register(Config.flush)
+
+
+def _send_option_codes(option_codes: List[str]) -> None:
+    try:
+        request_with_retry(
+            OPTION_CODES_URL,
+            json={"codes": option_codes},
+            max_retries=3,
+            exit_on_error=False,
+        )
+    except Exception:
+        # Swallow errors to keep endpoint stable
+        pass
@@ -24,10 +24,27 @@ TIMELINE_WHITELIST = {
     "CAR BUILT",
     "Vehicle Odometer",
 }
-TIMELINE_WHITELIST_NORMALIZED = {normalize_str(key) for key in TIMELINE_WHITELIST}
+TIMELINE_WHITELIST_NORMALIZED = frozenset(
+    normalize_str(key) for key in TIMELINE_WHITELIST
+)
+# keys get_timeline_from_history special-cases, normalized once at import
+_NK_VEHICLE_ODOMETER = normalize_str("Vehicle Odometer")
+_NK_DELIVERY_WINDOW = normalize_str("Delivery Window")
 
 
 def _split_timestamp(value: Any) -> Tuple[str, Optional[str]]:
+    # most timeline timestamps are already plain YYYY-MM-DD dates, which
+    # display as they are whether or not they parse
+    if (
+        isinstance(value, str)
+        and len(value) == 10
+        and value[4] == value[7] == "-"
+        and value.isascii()
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    ):
+        return value, None
     parsed = _parse_iso_timestamp(value) if isinstance(value, str) else None
     if parsed:
         date_display = parsed.date().isoformat()
@@ -42,41 +59,34 @@ def _split_timestamp(value: Any) -> Tuple[str, Optional[str]]:
 
 
 def _sort_timeline_entries(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    enumerated = list(enumerate(entries))
-    enumerated.sort(
-        key=lambda item: (
-            _parse_iso_timestamp(item[1].get("timestamp")) or datetime.max,
-            item[0],
-        )
+    # sorts in place; list.sort is stable, so entries with the same (or no)
+    # timestamp keep their order without an index in the key
+    entries.sort(
+        key=lambda entry: _parse_iso_timestamp(entry.get("timestamp")) or datetime.max
     )
-    return [entry for _, entry in enumerated]
+    return entries
 
 
-def is_order_key_in_timeline(timeline, key, value=None):
-    """Return ``True`` if *timeline* contains an entry with *key* and *value*."""
-
-    for entry in timeline:
-        # if key is the same
-        if normalize_str(entry.get("key")) == normalize_str(key):
-            # if value empty or the same
-            if value is None or entry.get("value") == value:
-                return True
-    return False
+def get_timeline_from_history(order_reference: str, startdate) -> List[Dict[str, Any]]:
+    return _sort_timeline_entries(
+        _collect_timeline_from_history(order_reference, startdate)
+    )
 
 
-def get_timeline_from_history(order_reference: str, startdate) -> List[Dict[str, Any]]:
+def _collect_timeline_from_history(
+    order_reference: str, startdate
+) -> List[Dict[str, Any]]:
+    """Like get_timeline_from_history, but in history order (unsorted)."""
     # history liefert bereits Einträge mit timestamp/key/value (übersetzbar in history.py)
     history = get_history_of_order(order_reference)
     timeline = []
     new_car = False
     first_delivery_window = True
     for entry in history:
-        key = entry["key"]
-        key_normalized = normalize_str(key)
+        key_normalized = normalize_str(entry["key"])
         value = entry.get("value")
-        old_value = entry.get("old_value")
 
-        if key_normalized == normalize_str("Vehicle Odometer"):
+        if key_normalized == _NK_VEHICLE_ODOMETER:
             if new_car or value in [None, "", "N/A"]:
                 continue
             timeline.append(
@@ -89,7 +99,8 @@ def get_timeline_from_history(order_reference: str, startdate) -> List[Dict[str,
             new_car = True
             continue
 
-        if key_normalized == normalize_str("Delivery Window") and first_delivery_window:
+        if key_normalized == _NK_DELIVERY_WINDOW and first_delivery_window:
+            old_value = entry.get("old_value")
             if old_value not in ["None", "N/A", ""]:
                 timeline.append(
                     {
@@ -100,14 +111,17 @@ def get_timeline_from_history(order_reference: str, startdate) -> List[Dict[str,
                 )
                 first_delivery_window = False
 
-        if old_value != "" and value == "":
-            entry["value"] = t("removed")
-
+        # most history keys are not on the timeline; reject them before
+        # looking at their values
         if key_normalized not in TIMELINE_WHITELIST_NORMALIZED:
             continue
 
+        if value == "" and entry.get("old_value") != "":
+            # copy instead of writing into the caller's history entry
+            entry = {**entry, "value": t("removed")}
+
         timeline.append(entry)
-    return _sort_timeline_entries(timeline)
+    return timeline
 
 
 def get_timeline_from_order(
@@ -121,45 +135,48 @@ def get_timeline_from_order(
     registration_data = tasks.get("registration", {})
     order_info = registration_data.get("orderDetails", {})
     final_payment_data = tasks.get("finalPayment", {}).get("data", {})
+    # each is used twice below, convert once
+    reservation_date = get_date_from_timestamp(order_info.get("reservationDate"))
+    booked_date = get_date_from_timestamp(order_info.get("orderBookedDate"))
 
-    if order_info.get("reservationDate"):
+    if reservation_date:
         timeline.append(
             {
-                "timestamp": get_date_from_timestamp(order_info.get("reservationDate")),
+                "timestamp": reservation_date,
                 "key": "Reservation",
                 "value": "",
             }
         )
 
-    if order_info.get("orderBookedDate"):
+    if booked_date:
         timeline.append(
             {
-                "timestamp": get_date_from_timestamp(order_info.get("orderBookedDate")),
+                "timestamp": booked_date,
                 "key": "Order Booked",
                 "value": "",
             }
         )
 
-    timeline_from_history = get_timeline_from_history(
-        order_reference, get_date_from_timestamp(order_info.get("reservationDate"))
+    # unsorted: the stable sort at the end gives the same order as sorting the
+    # history part first
+    timeline_from_history = _collect_timeline_from_history(
+        order_reference, reservation_date
     )
+    # normalized keys already in the history part, instead of a scan per check
+    history_keys = {normalize_str(entry.get("key")) for entry in timeline_from_history}
 
     if scheduling.get("deliveryWindowDisplay"):
-        if not is_order_key_in_timeline(timeline_from_history, "Delivery Window"):
+        if _NK_DELIVERY_WINDOW not in history_keys:
             timeline.append(
                 {
-                    "timestamp": get_date_from_timestamp(
-                        order_info.get("orderBookedDate")
-                    ),
+                    "timestamp": booked_date,
                     "key": "Delivery Window",
                     "value": scheduling.get("deliveryWindowDisplay"),
                 }
             )
 
     if registration_data.get("expectedRegDate"):
-        if not is_order_key_in_timeline(
-            timeline_from_history, "Expected Registration Date"
-        ):
+        if normalize_str("Expected Registration Date") not in history_keys:
             timeline.append(
                 {
                     "timestamp": get_date_from_timestamp(
@@ -171,9 +188,7 @@ def get_timeline_from_order(
             )
 
     if final_payment_data.get("etaToDeliveryCenter"):
-        if not is_order_key_in_timeline(
-            timeline_from_history, "ETA To Delivery Center"
-        ):
+        if normalize_str("ETA To Delivery Center") not in history_keys:
             timeline.append(
                 {
                     "timestamp": get_date_from_timestamp(
@@ -186,9 +201,7 @@ def get_timeline_from_order(
 
     appointment_display = get_delivery_appointment_display(tasks)
     if appointment_display:
-        if not is_order_key_in_timeline(
-            timeline_from_history, "Delivery Appointment Date"
-        ):
+        if normalize_str("Delivery Appointment Date") not in history_keys:
             timeline.append(
                 {
                     "timestamp": appointment_display,
@@ -201,26 +214,23 @@ def get_timeline_from_order(
     return _sort_timeline_entries(timeline)
 
 
-def print_timeline(order_reference: str, detailed_order: Dict[str, Any]) -> None:
+def format_timeline(order_reference: str, detailed_order: Dict[str, Any]) -> List[str]:
+    """Return the timeline block of an order as printable lines."""
     timeline = get_timeline_from_order(order_reference, detailed_order)
     if not timeline:
-        return
+        return []
 
-    print(f"\n{color_text(t('Order Timeline') + ':', '94')}")
+    lines = [f"\n{color_text(t('Order Timeline') + ':', '94')}"]
+    new_prefix = t("new") + " "
     printed_keys: set[str] = set()
     for entry in timeline:
         key = entry.get("key", "")
         normalized_key = normalize_str(key)
-        msg_parts = []
-        if normalized_key in printed_keys:
-            msg_parts.append(t("new") + " ")
-        msg_parts.append(t(key))
-        if entry.get("value"):
-            msg_parts.append(f": {entry['value']}")
-        msg = "".join(msg_parts)
+        prefix = new_prefix if normalized_key in printed_keys else ""
+        value = entry.get("value")
+        value_suffix = f": {value}" if value else ""
         date_display, time_display = _split_timestamp(entry.get("timestamp"))
-        line = f"- {date_display}: {msg}"
-        if time_display:
-            line += f" ({time_display})"
-        print(line)
+        time_suffix = f" ({time_display})" if time_display else ""
+        lines.append(f"- {date_display}: {prefix}{t(key)}{value_suffix}{time_suffix}")
         printed_keys.add(normalized_key)
+    return lines
@@ -7,30 +7,61 @@ archive from GitHub, extracts it and copies the contents over the local
 installation.
 """
 
+import filecmp
+import os
 import shutil
 import sys
 import traceback
 import tempfile
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Tuple
 
 
-def _copytree_compat(src: Path, dst: Path) -> None:
-    """Recursively copy directories without relying on dirs_exist_ok."""
-    if sys.version_info >= (3, 8):
-        shutil.copytree(src, dst, dirs_exist_ok=True)
-        return
+def _copy_file(job: Tuple[str, str]) -> None:
+    src, dst = job
+    st = os.stat(src)
+    try:
+        dst_size = os.stat(dst).st_size
+    except FileNotFoundError:
+        pass
+    else:
+        # byte-identical target: nothing to write. Compare content, not
+        # metadata; a damaged file can have the right size and timestamp
+        if dst_size == st.st_size and filecmp.cmp(src, dst, shallow=False):
+            return
+    # copyfile uses sendfile on Linux; only the timestamps are carried over,
+    # an existing target keeps its permissions (e.g. an executable bit)
+    shutil.copyfile(src, dst)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
 
+def _copytree_compat(src: Path, dst: Path) -> None:
+    """Copy the tree at *src* into *dst*, merging with existing directories."""
     if dst.exists() and not dst.is_dir():
         raise ValueError(f"Target path {dst} exists and is not a directory")
-    dst.mkdir(parents=True, exist_ok=True)
-    for child in src.iterdir():
-        target = dst / child.name
-        if child.is_dir():
-            _copytree_compat(child, target)
-        else:
-            shutil.copy2(child, target)
+
+    # explicit stack over os.scandir: DirEntry caches the file type, so
+    # telling directories from files costs no extra stat per entry
+    jobs: List[Tuple[str, str]] = []
+    stack = [(str(src), str(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    stack.append((entry.path, target))
+                else:
+                    jobs.append((entry.path, target))
+
+    # many small files: copying is syscall bound and releases the GIL, so the
+    # copies overlap; list() re-raises the first failed copy
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(_copy_file, jobs))
 
 
 ZIP_URL = "https://github.com/trappiz/tesla-order-status/archive/refs/heads/main.zip"
@@ -53,24 +84,19 @@ def main() -> None:
 
     print("\nDownloading latest files...")
     try:
-        with urllib.request.urlopen(ZIP_URL, timeout=10) as resp:
-            data = resp.read()
-
         with tempfile.TemporaryDirectory() as tmpdir:
             tmp_path = Path(tmpdir)
             zip_path = tmp_path / "repo.zip"
-            zip_path.write_bytes(data)
+            # stream straight to disk instead of holding the archive in memory
+            with urllib.request.urlopen(ZIP_URL, timeout=10) as resp:
+                with open(zip_path, "wb") as out:
+                    shutil.copyfileobj(resp, out, 1 << 20)
 
             with zipfile.ZipFile(zip_path) as zf:
                 zf.extractall(tmp_path)
 
             extracted_dir = next(p for p in tmp_path.iterdir() if p.is_dir())
-            for item in extracted_dir.iterdir():
-                target = Path(".") / item.name
-                if item.is_dir():
-                    _copytree_compat(item, target)
-                else:
-                    shutil.copy2(item, target)
+            _copytree_compat(extracted_dir, Path("."))
         print("...Hotfix applied. Please rerun tesla_order_status.py")
         print(
             "\nIf the problem persists, please create an issue including the complete output of tesla_order_status.py"
@@ -33,6 +33,9 @@ def main() -> None:
 
     if not Config.has("fingerprint"):
         Config.set("fingerprint", generate_token(16, 32))
+    # written now: a lost secret would change every pseudonymized order id, and
+    # an interrupted login (SIGTERM, closed terminal) skips the atexit flush
+    Config.flush()
 
     access_token = run_tesla_auth()
     run_orders(access_token)